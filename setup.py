@@ -0,0 +1,20 @@
+"""Build script for bedrock-swarm.
+
+Project metadata lives in pyproject.toml. This script only adds optional mypyc
+compilation of hot-path modules, enabled with ``BEDROCK_SWARM_MYPYC=1``.
+"""
+
+import os
+
+from setuptools import setup
+
+# Modules compiled to C extensions when mypyc compilation is enabled
+MYPYC_MODULES = ["src/bedrock_swarm/events.py"]
+
+ext_modules = []
+if os.environ.get("BEDROCK_SWARM_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["--follow-imports=silent", *MYPYC_MODULES])
+
+setup(ext_modules=ext_modules)
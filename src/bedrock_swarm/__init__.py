@@ -6,6 +6,7 @@ from .config import AWSConfig
 from .exceptions import (
     AgencyError,
     AgentError,
+    BedrockSwarmError,
     ModelError,
     ModelInvokeError,
     ResponseParsingError,
@@ -25,6 +26,7 @@ __all__ = [
     "BedrockAgent",
     "AWSConfig",
     "configure_logging",
+    "BedrockSwarmError",
     "AgencyError",
     "AgentError",
     "ModelError",
@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Dict, List, Literal, Optional
 from uuid import uuid4
 
+from .. import serialization
 from ..agents.base import BedrockAgent
 from ..memory.base import Message
 from ..types import ToolCall, ToolOutput, ToolResult
@@ -244,16 +245,24 @@ class Thread:
         logger.debug(f"Thread {self.id}: Executing {len(tool_calls)} tool calls")
         tool_outputs = []
 
+        # Hoist lookups that stay the same for every tool call
+        create_event = self.event_system.create_event
+        tools = self.agent.tools
+        agent_name = self.agent.name
+        run_id = self.current_run.id if self.current_run else "none"
+
         for tool_call in tool_calls:
             logger.debug(f"Thread {self.id}: Executing tool call: {tool_call}")
+            tool_name = tool_call["function"]["name"]
+
             # Create tool start event
-            tool_start_id = self.event_system.create_event(
+            tool_start_id = create_event(
                 type="tool_start",
-                agent_name=self.agent.name,
-                run_id=self.current_run.id if self.current_run else "none",
+                agent_name=agent_name,
+                run_id=run_id,
                 thread_id=self.id,
                 details={
-                    "tool_name": tool_call["function"]["name"],
+                    "tool_name": tool_name,
                     "arguments": tool_call["function"]["arguments"],
                 },
             )
@@ -261,16 +270,16 @@ class Thread:
 
             try:
                 # Get the tool
-                tool = self.agent.tools.get(tool_call["function"]["name"])
+                tool = tools.get(tool_name)
                 if not tool:
-                    raise ValueError(f"Tool {tool_call['function']['name']} not found")
+                    raise ValueError(f"Tool {tool_name} not found")
 
                 # Parse arguments - handle both string and dict formats
                 args = tool_call["function"]["arguments"]
                 if isinstance(args, str):
                     try:
-                        arguments = json.loads(args)
-                    except json.JSONDecodeError as e:
+                        arguments = serialization.loads(args)
+                    except serialization.JSONDecodeError as e:
                         raise ValueError(f"Invalid tool arguments JSON: {e}")
                 else:
                     arguments = args  # Already a dict
@@ -278,9 +287,7 @@ class Thread:
                 logger.debug(f"Thread {self.id}: Parsed arguments: {arguments}")
 
                 # Execute tool
-                logger.debug(
-                    f"Thread {self.id}: Executing tool {tool_call['function']['name']}"
-                )
+                logger.debug(f"Thread {self.id}: Executing tool {tool_name}")
                 result = tool.execute(**arguments, thread=self)
                 logger.debug(f"Thread {self.id}: Tool result: {result}")
 
@@ -292,31 +299,29 @@ class Thread:
                 tool_outputs.append(output)
 
                 # Create tool complete event
-                self.event_system.create_event(
+                create_event(
                     type="tool_complete",
-                    agent_name=self.agent.name,
-                    run_id=self.current_run.id if self.current_run else "none",
+                    agent_name=agent_name,
+                    run_id=run_id,
                     thread_id=self.id,
                     details={
-                        "tool_name": tool_call["function"]["name"],
+                        "tool_name": tool_name,
                         "arguments": arguments,
                         "result": result,
                     },
                 )
 
             except Exception as e:
-                error_msg = (
-                    f"Error executing tool {tool_call['function']['name']}: {str(e)}"
-                )
+                error_msg = f"Error executing tool {tool_name}: {str(e)}"
                 logger.error(error_msg)
-                self.event_system.create_event(
+                create_event(
                     type="tool_error",
-                    agent_name=self.agent.name,
-                    run_id=self.current_run.id if self.current_run else "none",
+                    agent_name=agent_name,
+                    run_id=run_id,
                     thread_id=self.id,
                     details={
                         "error": error_msg,
-                        "tool_name": tool_call["function"]["name"],
+                        "tool_name": tool_name,
                         "arguments": tool_call["function"]["arguments"],
                     },
                 )
@@ -349,7 +354,7 @@ class Thread:
             # Parse arguments - handle both string and dict formats for backward compatibility
             args = tool_call["function"]["arguments"]
             if isinstance(args, str):
-                args = json.loads(args)
+                args = serialization.loads(args)
 
             # Get and execute tool
             tool = self.agent.tools[tool_name]
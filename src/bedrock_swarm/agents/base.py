@@ -5,10 +5,12 @@ This module provides a flexible architecture for supporting multiple Bedrock mod
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
+from botocore.client import BaseClient
 
 from ..config import AWSConfig
 from ..exceptions import InvalidModelError
@@ -21,6 +23,29 @@ from ..types import AgentResponse
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Response format instructions shared by every agent prompt
+RESPONSE_FORMAT = "\n".join(
+    [
+        "\n<response_format>",
+        "You must respond in one of two formats:",
+        "\n1. To use a tool:",
+        "Respond with ONLY a JSON object in this exact format (no explanation text outside the JSON):",
+        '{"type": "tool_call", "tool_calls": [{"id": "call_1", "type": "function", "function": {"name": "tool_name", "arguments": {"arg1": "value1"}}}]}',
+        "\n2. For normal responses:",
+        "Respond with ONLY a JSON object in this exact format (no explanation text outside the JSON):",
+        '{"type": "message", "content": "your natural language response here"}',
+        "\n<rules>",
+        "- Always use proper JSON with double quotes",
+        "- Never include explanations or text outside the JSON object",
+        "- Tool arguments must be a valid JSON object, not a string",
+        "- Respond with exactly one complete JSON object",
+        "- Maintain conversation context from history",
+        "- Reference previous tool results when relevant",
+        "</rules>",
+        "</response_format>",
+    ]
+)
+
 
 class BedrockAgent:
     """Base class for Bedrock-powered agents.
@@ -32,6 +57,25 @@ class BedrockAgent:
     4. A Bedrock model for processing
     """
 
+    __slots__ = (
+        "model_id",
+        "name",
+        "role",
+        "tools",
+        "memory",
+        "system_prompt",
+        "native_tools",
+        "session",
+        "model",
+        "_client",
+        "_tools_cache",
+        "_tools_cache_key",
+        "_prompt_prefix",
+        "_prompt_prefix_key",
+        "_last_token_count",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         model_id: str,
@@ -40,6 +84,7 @@ class BedrockAgent:
         tools: Optional[List[BaseTool]] = None,
         memory: Optional[BaseMemory] = None,
         system_prompt: Optional[str] = None,
+        native_tools: bool = False,
     ) -> None:
         """Initialize the agent.
 
@@ -50,6 +95,9 @@ class BedrockAgent:
             tools: Optional list of tools available to the agent
             memory: Optional memory system (defaults to SimpleMemory)
             system_prompt: Optional system prompt
+            native_tools: Send tools through the model's native tool use API
+                instead of describing them in the prompt, when the model
+                supports it
 
         Raises:
             InvalidModelError: If model ID is not supported
@@ -60,6 +108,15 @@ class BedrockAgent:
         self.tools = {tool.name: tool for tool in tools} if tools else {}
         self.memory = memory or SimpleMemory()
         self.system_prompt = system_prompt
+        self.native_tools = native_tools
+
+        # Cached tools section of the prompt, keyed on the registered tools
+        self._tools_cache = ""
+        self._tools_cache_key: Tuple[Tuple[str, BaseTool], ...] = ()
+
+        # Cached static prompt prefix, keyed on the values it is built from
+        self._prompt_prefix = ""
+        self._prompt_prefix_key: Optional[Tuple[Optional[str], str, str]] = None
 
         logger.debug(f"Initializing agent {name} with role: {role}")
         logger.debug(f"Available tools: {list(self.tools.keys())}")
@@ -70,6 +127,9 @@ class BedrockAgent:
             profile_name=AWSConfig.profile,
         )
 
+        # Bedrock client, created on first use and shared by later requests
+        self._client: Optional[BaseClient] = None
+
         # Initialize model
         self.model = self._initialize_model()
 
@@ -86,30 +146,18 @@ class BedrockAgent:
         This method builds a comprehensive prompt that includes:
         1. System prompt and role context
         2. Available tools and their schemas
-        3. Recent conversation history
-        4. Response format instructions
+        3. Response format instructions
+        4. Recent conversation history
         5. Current message
-        """
-        prompt = []
 
-        # Add system prompt if provided
-        if self.system_prompt:
-            prompt.append(f"System: {self.system_prompt}")
-
-        # Add role context
-        prompt.append(f"You are a specialized agent with expertise in: {self.role}")
-
-        # Add available tools
-        if self.tools:
-            prompt.append("\n<tools>")
-            for tool in self.tools.values():
-                prompt.append(f"- {tool.name}: {tool.description}")
-                schema = tool.get_schema()
-                prompt.append(f"  Schema: {json.dumps(schema, indent=2)}")
-            prompt.append("</tools>")
+        The first three sections only change when the agent is reconfigured, so
+        they are cached and always placed first. Keeping this prefix
+        byte-identical across requests lets Bedrock reuse its prompt cache.
+        """
+        prompt = [self._get_prompt_prefix()]
 
         # Add conversation history from memory
-        recent_messages = self.memory.get_messages()[-5:]  # Get last 5 messages
+        recent_messages = self.memory.get_recent_messages(5)  # Get last 5 messages
         if recent_messages:
             prompt.append("\n<conversation_history>")
             for msg in recent_messages:
@@ -122,34 +170,79 @@ class BedrockAgent:
                 prompt.append(f"{msg.role}{tool_info}: {msg.content}")
             prompt.append("</conversation_history>")
 
-        # Add response format instructions using XML
-        prompt.extend(
-            [
-                "\n<response_format>",
-                "You must respond in one of two formats:",
-                "\n1. To use a tool:",
-                "Respond with ONLY a JSON object in this exact format (no explanation text outside the JSON):",
-                '{"type": "tool_call", "tool_calls": [{"id": "call_1", "type": "function", "function": {"name": "tool_name", "arguments": {"arg1": "value1"}}}]}',
-                "\n2. For normal responses:",
-                "Respond with ONLY a JSON object in this exact format (no explanation text outside the JSON):",
-                '{"type": "message", "content": "your natural language response here"}',
-                "\n<rules>",
-                "- Always use proper JSON with double quotes",
-                "- Never include explanations or text outside the JSON object",
-                "- Tool arguments must be a valid JSON object, not a string",
-                "- Respond with exactly one complete JSON object",
-                "- Maintain conversation context from history",
-                "- Reference previous tool results when relevant",
-                "</rules>",
-                "</response_format>",
-                f"\n<input>{message}</input>",
-            ]
-        )
+        prompt.append(f"\n<input>{message}</input>")
 
         final_prompt = "\n".join(prompt)
         logger.debug(f"Built prompt for agent {self.name}:\n{final_prompt}")
         return final_prompt
 
+    def _get_prompt_prefix(self) -> str:
+        """Get the static part of the prompt.
+
+        Returns:
+            System prompt, role context, tools and response format instructions
+        """
+        tools = (
+            self._format_tools() if self.tools and not self._uses_native_tools() else ""
+        )
+        prefix_key = (self.system_prompt, self.role, tools)
+        if self._prompt_prefix_key != prefix_key:
+            prefix = []
+
+            # Add system prompt if provided
+            if self.system_prompt:
+                prefix.append(f"System: {self.system_prompt}")
+
+            # Add role context
+            prefix.append(f"You are a specialized agent with expertise in: {self.role}")
+
+            # Add available tools
+            if tools:
+                prefix.append(tools)
+
+            # Add response format instructions using XML
+            prefix.append(RESPONSE_FORMAT)
+
+            self._prompt_prefix = "\n".join(prefix)
+            self._prompt_prefix_key = prefix_key
+        return self._prompt_prefix
+
+    def _format_tools(self) -> str:
+        """Format the tools section of the prompt.
+
+        Serializing tool schemas is the most expensive part of prompt building,
+        so the formatted section is cached and only rebuilt when the set of
+        tools changes.
+
+        Returns:
+            Formatted tools section
+        """
+        tools_key = tuple(self.tools.items())
+        if self._tools_cache_key != tools_key:
+            lines = ["\n<tools>"]
+            for tool in self.tools.values():
+                lines.append(f"- {tool.name}: {tool.description}")
+                lines.append(f"  Schema: {json.dumps(tool.schema, indent=2)}")
+            lines.append("</tools>")
+            self._tools_cache = "\n".join(lines)
+            self._tools_cache_key = tools_key
+        return self._tools_cache
+
+    def _uses_native_tools(self) -> bool:
+        """Check whether tools are sent through the model's native tool use."""
+        return self.native_tools and self.model.supports_tools()
+
+    def _get_tool_schemas(self) -> Optional[List[Dict[str, Any]]]:
+        """Get the tool schemas to send with a request.
+
+        Returns:
+            Schemas of the agent's tools when native tool use is enabled,
+            otherwise None
+        """
+        if not self.tools or not self._uses_native_tools():
+            return None
+        return [tool.schema for tool in self.tools.values()]
+
     def generate(self, message: str) -> AgentResponse:
         """Generate a response to a message.
 
@@ -168,54 +261,147 @@ class BedrockAgent:
         logger.debug(f"Agent {self.name} generating response for message: {message}")
 
         # Record incoming message in memory
-        self.memory.add_message(
-            Message(
-                role="user",
-                content=message,
-                timestamp=datetime.now(),
-                metadata={"type": "user_message", "agent": self.name},
-            )
-        )
+        self._record_user_message(message)
 
         # Get bedrock client
-        client = self.session.client(
-            "bedrock-runtime",
-            endpoint_url=AWSConfig.endpoint_url,
-        )
+        client = self._get_client()
 
         # Build prompt and get response
         prompt = self._build_prompt(message)
-        response = self.model.invoke(client=client, message=prompt)
+        response = self.model.invoke(
+            client=client, message=prompt, tools=self._get_tool_schemas()
+        )
         logger.debug(f"Raw model response: {response}")
 
-        # Record the response in memory with appropriate metadata
-        if response.get("type") == "tool_call":
-            # Record tool call intent
-            self.memory.add_message(
-                Message(
-                    role="assistant",
-                    content=json.dumps(response["tool_calls"]),
-                    timestamp=datetime.now(),
-                    metadata={
-                        "type": "tool_call_intent",
-                        "agent": self.name,
-                        "tool_calls": response["tool_calls"],
-                    },
+        # Record the response and return it
+        self._record_response(response)
+        return response
+
+    def generate_batch(
+        self, messages: List[str], max_workers: Optional[int] = None
+    ) -> List[AgentResponse]:
+        """Generate responses to several independent messages concurrently.
+
+        All prompts are built against the conversation history as it stands
+        before the batch, then sent to Bedrock in parallel over a single
+        client. Messages and responses are recorded in memory in input order.
+
+        Args:
+            messages: Messages to respond to
+            max_workers: Optional maximum number of concurrent model invocations
+                (defaults to one per message)
+
+        Returns:
+            Responses in the same order as the input messages
+        """
+        if not messages:
+            return []
+
+        logger.debug(f"Agent {self.name} generating {len(messages)} batched responses")
+
+        # Build all prompts before recording anything so they share one history
+        prompts = [self._build_prompt(message) for message in messages]
+
+        self.memory.add_messages([self._user_message(m) for m in messages])
+
+        # boto3 clients are thread-safe, so one client serves the whole batch
+        client = self._get_client()
+        tools = self._get_tool_schemas()
+        with ThreadPoolExecutor(max_workers=max_workers or len(prompts)) as executor:
+            responses = list(
+                executor.map(
+                    lambda prompt: self.model.invoke(
+                        client=client, message=prompt, tools=tools
+                    ),
+                    prompts,
                 )
             )
-        else:
-            # Record normal message response
-            self.memory.add_message(
-                Message(
-                    role="assistant",
-                    content=response.get("content", ""),
-                    timestamp=datetime.now(),
-                    metadata={"type": "assistant_response", "agent": self.name},
-                )
+
+        self.memory.add_messages([self._response_message(r) for r in responses])
+
+        return responses
+
+    def _get_client(self) -> BaseClient:
+        """Get the agent's Bedrock runtime client.
+
+        The client is created from the agent's session on first use and then
+        reused, so its pooled connections stay open between requests.
+        """
+        if self._client is None:
+            self._client = BedrockModel.make_client(
+                session=self.session,
+                endpoint_url=AWSConfig.endpoint_url,
             )
+        return self._client
 
-        # Return the processed response
-        return response
+    def _record_user_message(self, message: str) -> None:
+        """Record an incoming user message in memory.
+
+        Args:
+            message: Message received by the agent
+        """
+        self.memory.add_message(self._user_message(message))
+
+    def _user_message(self, message: str) -> Message:
+        """Build the memory entry for an incoming user message.
+
+        Args:
+            message: Message received by the agent
+
+        Returns:
+            Message to record
+        """
+        return Message(
+            role="user",
+            content=message,
+            timestamp=datetime.now(),
+            metadata={"type": "user_message", "agent": self.name},
+        )
+
+    def _record_response(self, response: AgentResponse) -> None:
+        """Record a model response in memory with appropriate metadata.
+
+        Args:
+            response: Processed model response
+        """
+        self.memory.add_message(self._response_message(response))
+
+    def _response_message(self, response: AgentResponse) -> Message:
+        """Build the memory entry for a model response.
+
+        Also updates the token count of the last exchange when the response
+        reports usage.
+
+        Args:
+            response: Processed model response
+
+        Returns:
+            Message to record
+        """
+        usage = response.get("usage")
+        if usage:
+            self._last_token_count = usage["input_tokens"] + usage["output_tokens"]
+
+        if response.get("type") == "tool_call":
+            # Record tool call intent
+            return Message(
+                role="assistant",
+                content=json.dumps(response["tool_calls"]),
+                timestamp=datetime.now(),
+                metadata={
+                    "type": "tool_call_intent",
+                    "agent": self.name,
+                    "tool_calls": response["tool_calls"],
+                },
+            )
+
+        # Record normal message response
+        return Message(
+            role="assistant",
+            content=response.get("content", ""),
+            timestamp=datetime.now(),
+            metadata={"type": "assistant_response", "agent": self.name},
+        )
 
     def _format_prompt(self, message: str, history: List[Message]) -> str:
         """Format the prompt with message history.
@@ -228,16 +414,15 @@ class BedrockAgent:
             Formatted prompt string
         """
         # Start with system prompt if provided
-        prompt = f"{self.system_prompt}\n\n" if self.system_prompt else ""
+        parts = [f"{self.system_prompt}\n\n"] if self.system_prompt else []
 
         # Add message history
-        for msg in history:
-            prompt += f"{msg.role}: {msg.content}\n"
+        parts.extend(f"{msg.role}: {msg.content}\n" for msg in history)
 
         # Add current message
-        prompt += f"human: {message}\nassistant:"
+        parts.append(f"human: {message}\nassistant:")
 
-        return prompt
+        return "".join(parts)
 
     @property
     def last_token_count(self) -> int:
@@ -17,20 +17,3 @@ class AWSConfig:
     region: str
     profile: Optional[str] = None
     endpoint_url: Optional[str] = None
-
-    def __init__(
-        self,
-        region: str,
-        profile: Optional[str] = None,
-        endpoint_url: Optional[str] = None,
-    ) -> None:
-        """Initialize AWS configuration.
-
-        Args:
-            region (str): AWS region
-            profile (Optional[str]): AWS profile name
-            endpoint_url (Optional[str]): Custom endpoint URL
-        """
-        self.region = region
-        self.profile = profile
-        self.endpoint_url = endpoint_url
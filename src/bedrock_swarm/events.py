@@ -1,7 +1,8 @@
 """Event system for tracking agent and tool interactions."""
 
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, DefaultDict, Dict, List, Optional
 from uuid import uuid4
 
 from .types import Event, EventType
@@ -22,6 +23,16 @@ class EventSystem:
         self.events: List[Event] = []
         self.current_event_id: Optional[str] = None
 
+        # Indexes over self.events, each preserving chronological order
+        self._by_id: Dict[str, Event] = {}
+        self._by_run: DefaultDict[str, List[Event]] = defaultdict(list)
+        self._by_thread: DefaultDict[str, List[Event]] = defaultdict(list)
+        self._by_agent: DefaultDict[str, List[Event]] = defaultdict(list)
+        self._by_type: DefaultDict[str, List[Event]] = defaultdict(list)
+
+        # Formatted output of events owned by this system, keyed by event ID
+        self._formatted: Dict[str, str] = {}
+
     def create_event(
         self,
         type: EventType,
@@ -44,11 +55,11 @@ class EventSystem:
         Returns:
             ID of the created event
         """
-        event_id = str(uuid4())
+        event_id = uuid4().hex
         event: Event = {
             "id": event_id,
             "type": type,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now().isoformat(timespec="microseconds"),
             "agent_name": agent_name,
             "run_id": run_id,
             "thread_id": thread_id,
@@ -58,6 +69,11 @@ class EventSystem:
         }
 
         self.events.append(event)
+        self._by_id[event_id] = event
+        self._by_run[run_id].append(event)
+        self._by_thread[thread_id].append(event)
+        self._by_agent[agent_name].append(event)
+        self._by_type[type].append(event)
         return event_id
 
     def start_event_scope(self, event_id: str) -> None:
@@ -93,18 +109,30 @@ class EventSystem:
         Returns:
             List of matching events in chronological order
         """
-        filtered = self.events
-
-        if run_id:
-            filtered = [e for e in filtered if e["run_id"] == run_id]
-        if thread_id:
-            filtered = [e for e in filtered if e["thread_id"] == thread_id]
-        if agent_name:
-            filtered = [e for e in filtered if e["agent_name"] == agent_name]
-        if event_type:
-            filtered = [e for e in filtered if e["type"] == event_type]
-
-        return filtered
+        candidates: List[List[Event]] = []
+        for index, value in (
+            (self._by_run, run_id),
+            (self._by_thread, thread_id),
+            (self._by_agent, agent_name),
+            (self._by_type, event_type),
+        ):
+            if value:
+                if value not in index:
+                    return []  # No events match this filter
+                candidates.append(index[value])
+
+        if not candidates:
+            return self.events
+
+        # Start from the most selective index and check the other filters
+        return [
+            e
+            for e in min(candidates, key=len)
+            if (not run_id or e["run_id"] == run_id)
+            and (not thread_id or e["thread_id"] == thread_id)
+            and (not agent_name or e["agent_name"] == agent_name)
+            and (not event_type or e["type"] == event_type)
+        ]
 
     def get_event_chain(self, event_id: str) -> List[Event]:
         """Get the chain of events leading to the specified event.
@@ -117,16 +145,13 @@ class EventSystem:
         Returns:
             List of events in the chain, from root to specified event
         """
-        chain = []
-        current = next((e for e in self.events if e["id"] == event_id), None)
+        chain: List[Event] = []
+        current = self._by_id.get(event_id)
 
         while current:
             chain.append(current)
             if current["parent_event_id"]:
-                current = next(
-                    (e for e in self.events if e["id"] == current["parent_event_id"]),
-                    None,
-                )
+                current = self._by_id.get(current["parent_event_id"])
             else:
                 break
 
@@ -141,32 +166,47 @@ class EventSystem:
         Returns:
             Formatted string representation of the event
         """
-        # Parse timestamp for formatting
-        timestamp = datetime.fromisoformat(event["timestamp"])
-        time_str = timestamp.strftime("%H:%M:%S.%f")[:-3]
+        # Events recorded by this system are never modified, so their
+        # formatted output can be reused across calls
+        owned = self._by_id.get(event["id"]) is event
+        if owned and event["id"] in self._formatted:
+            return self._formatted[event["id"]]
+
+        # Events created by create_event carry fixed-width ISO timestamps
+        # (YYYY-MM-DDTHH:MM:SS.ffffff), so the time can be sliced without parsing
+        timestamp = event["timestamp"]
+        if len(timestamp) == 26:
+            time_str = timestamp[11:23]
+        else:
+            parsed = datetime.fromisoformat(timestamp)
+            time_str = parsed.strftime("%H:%M:%S.%f")[:-3]
 
         # Format basic event info
         lines = [
             f"[{time_str}] {event['type'].upper()} - Agent: {event['agent_name']}",
         ]
+        append = lines.append
 
         # Add event details
         if event["details"]:
             for key, value in event["details"].items():
                 if isinstance(value, dict):
-                    lines.append(f"  {key}:")
+                    append(f"  {key}:")
                     for k, v in value.items():
-                        lines.append(f"    {k}: {v}")
+                        append(f"    {k}: {v}")
                 else:
-                    lines.append(f"  {key}: {value}")
+                    append(f"  {key}: {value}")
 
         # Add metadata if present
         if event["metadata"]:
-            lines.append("  Metadata:")
+            append("  Metadata:")
             for key, value in event["metadata"].items():
-                lines.append(f"    {key}: {value}")
+                append(f"    {key}: {value}")
 
-        return "\n".join(lines)
+        formatted = "\n".join(lines)
+        if owned:
+            self._formatted[event["id"]] = formatted
+        return formatted
 
     def format_event_chain(self, event_id: str) -> str:
         """Format a chain of events for display.
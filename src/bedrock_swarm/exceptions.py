@@ -1,85 +1,85 @@
 """Exceptions for bedrock-swarm."""
 
 
-class AgencyError(Exception):
+class BedrockSwarmError(Exception):
+    """Base exception class for bedrock-swarm."""
+
+    __slots__ = ()
+
+
+class AgencyError(BedrockSwarmError):
     """Base exception for agency-related errors."""
 
-    pass
+    __slots__ = ()
 
 
-class AgentError(Exception):
+class AgentError(BedrockSwarmError):
     """Base exception for agent-related errors."""
 
-    pass
+    __slots__ = ()
 
 
-class ModelError(Exception):
+class ModelError(BedrockSwarmError):
     """Base exception for model-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class ModelInvokeError(ModelError):
     """Exception raised when there is an error invoking a model."""
 
-    pass
+    __slots__ = ()
 
 
 class ResponseParsingError(ModelError):
     """Exception raised when there is an error parsing a model response."""
 
-    pass
+    __slots__ = ()
 
 
-class ToolError(Exception):
-    """Base exception for tool-related errors."""
+class InvalidModelError(ModelError):
+    """Raised when an invalid model ID is provided."""
 
-    pass
+    __slots__ = ()
 
 
-class ToolExecutionError(ToolError):
-    """Exception raised when there is an error executing a tool."""
+class InvalidTemperatureError(ModelError):
+    """Raised when an invalid temperature value is provided."""
 
-    pass
+    __slots__ = ()
 
 
-class BedrockSwarmError(Exception):
-    """Base exception class for bedrock-swarm."""
+class ToolError(BedrockSwarmError):
+    """Base exception for tool-related errors."""
 
-    pass
+    __slots__ = ()
 
 
-class InvalidModelError(ModelError):
-    """Raised when an invalid model ID is provided."""
+class ToolExecutionError(ToolError):
+    """Exception raised when there is an error executing a tool."""
 
-    pass
+    __slots__ = ()
 
 
-class InvalidTemperatureError(ModelError):
-    """Raised when an invalid temperature value is provided."""
+class ToolNotFoundError(ToolError):
+    """Raised when a requested tool is not found."""
 
-    pass
+    __slots__ = ()
 
 
 class ConfigError(BedrockSwarmError):
     """Raised when there is an error with the configuration."""
 
-    pass
+    __slots__ = ()
 
 
 class AWSConfigError(ConfigError):
     """Raised when there is an error with AWS configuration."""
 
-    pass
-
-
-class ToolNotFoundError(ToolError):
-    """Raised when a requested tool is not found."""
-
-    pass
+    __slots__ = ()
 
 
 class ThreadError(BedrockSwarmError):
     """Raised when there is an error with thread operations."""
 
-    pass
+    __slots__ = ()
@@ -1,15 +1,109 @@
 """Logging configuration for Bedrock Swarm."""
 
+from __future__ import annotations
+
+import atexit
 import logging
+import os
+import queue
 import sys
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+
+# Library records are enqueued on the caller's thread and written by a single
+# background listener thread that owns the real handlers
+_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_queue_handler = QueueHandler(_queue)
+_listener: QueueListener | None = None
+
+
+class _DeferredFlushStreamHandler(logging.StreamHandler):
+    """Stream handler that leaves flushing to the listener.
+
+    The listener flushes once after draining a batch of queued records, so a
+    burst of log calls costs one flush instead of one per record.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a formatted record without flushing the stream."""
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingQueueListener(QueueListener):
+    """Queue listener that flushes its handlers once per drained batch."""
+
+    def __init__(
+        self,
+        records: queue.SimpleQueue[logging.LogRecord],
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+    ) -> None:
+        """Initialize the listener.
+
+        Args:
+            records: Queue the library's QueueHandler writes to
+            *handlers: Handlers that write the records out
+            respect_handler_level: Whether to honour each handler's level
+        """
+        super().__init__(
+            records, *handlers, respect_handler_level=respect_handler_level
+        )
+        self._records = records
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Dispatch a record, flushing the handlers when the queue is empty."""
+        super().handle(record)
+        if self._records.empty():
+            self._flush()
+
+    def stop(self) -> None:
+        """Stop the listener and flush anything still buffered."""
+        super().stop()
+        self._flush()
+
+    def _flush(self) -> None:
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # The stream may already be closed, e.g. during shutdown
+                pass
+
+
+if sys.version_info >= (3, 11):
+    _LEVELS = logging.getLevelNamesMapping()
+else:  # pragma: no cover
+    _LEVELS = {
+        name: getattr(logging, name)
+        for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL", "NOTSET")
+    }
+
+
+def _get_level(level: str) -> int:
+    """Resolve a level name to its numeric logging level.
+
+    Args:
+        level: Level name, case-insensitive
+
+    Returns:
+        Numeric logging level
+
+    Raises:
+        ValueError: If the level name is unknown
+    """
+    try:
+        return _LEVELS[level.upper()]
+    except KeyError:
+        raise ValueError(f"Invalid log level: {level}") from None
 
 
 def configure_logging(
     level: str = "WARNING",
-    format_string: Optional[str] = None,
+    format_string: str | None = None,
     date_format: str = "%Y-%m-%d %H:%M:%S",
-    handlers: Optional[list] = None,
+    handlers: list[logging.Handler] | None = None,
 ) -> None:
     """Configure logging with a standard format.
 
@@ -18,31 +112,115 @@ def configure_logging(
         format_string: Custom format string for log messages. If None, uses default format.
         date_format: Date format for timestamps. Defaults to ISO format.
         handlers: List of custom handlers. If None, uses StreamHandler to stdout.
+
+    Raises:
+        ValueError: If the level name is unknown
     """
+    log_level = _get_level(level)
+
     # Default format if none provided
     if format_string is None:
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-    # Default handler if none provided
+    # Default handler if none provided. The root logger writes synchronously,
+    # so it gets its own handler that flushes every record.
+    root_handlers: list[logging.Handler]
     if handlers is None:
-        handlers = [logging.StreamHandler(sys.stdout)]
+        handlers = [_DeferredFlushStreamHandler(sys.stdout)]
+        root_handlers = [logging.StreamHandler(sys.stdout)]
+    else:
+        root_handlers = handlers
 
     # Configure root logger
     logging.basicConfig(
-        level=getattr(logging, level.upper()),
+        level=log_level,
         format=format_string,
         datefmt=date_format,
-        handlers=handlers,
+        handlers=root_handlers,
     )
 
     # Configure bedrock_swarm logger
     logger = logging.getLogger("bedrock_swarm")
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(log_level)
+
+    # Records are emitted by our own handlers only, not again by the root logger
+    logger.propagate = False
 
-    # Add handlers to bedrock_swarm logger
+    # Add handlers to the listener, reusing any equivalent handler that an
+    # earlier call already attached so repeated calls stay idempotent
+    global _listener
+    formatter = logging.Formatter(format_string, date_format)
+    targets = list(_listener.handlers) if _listener is not None else []
     for handler in handlers:
-        handler.setFormatter(logging.Formatter(format_string, date_format))
-        logger.addHandler(handler)
+        existing = _find_equivalent_handler(targets, handler)
+        if existing is None:
+            targets.append(handler)
+            existing = handler
+        existing.setFormatter(formatter)
+
+    _stop_listener()
+    _listener = _BatchingQueueListener(_queue, *targets, respect_handler_level=True)
+    _listener.start()
+
+    if _queue_handler not in logger.handlers:
+        logger.addHandler(_queue_handler)
+
+
+def _stop_listener() -> None:
+    """Stop the background listener, writing out any queued records."""
+    if _listener is not None and _listener._thread is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
+
+
+def _restart_listener_in_child() -> None:
+    """Give a forked child process its own queue and listener thread.
+
+    Only the forking thread survives a fork, so without this the child keeps
+    enqueueing records that no listener ever writes. The child gets a fresh
+    queue, because records the parent had queued are still written by the
+    parent's listener.
+    """
+    global _queue, _listener
+    _queue = queue.SimpleQueue()
+    _queue_handler.queue = _queue
+    parent = _listener
+    if parent is not None and parent._thread is not None:
+        _listener = _BatchingQueueListener(
+            _queue, *parent.handlers, respect_handler_level=parent.respect_handler_level
+        )
+        _listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
+
+
+def _find_equivalent_handler(
+    handlers: list[logging.Handler], handler: logging.Handler
+) -> logging.Handler | None:
+    """Find a handler in the list that writes to the same destination.
+
+    Args:
+        handlers: Handlers to search
+        handler: Handler to look for
+
+    Returns:
+        The matching handler, or None if there is none
+    """
+    stream = getattr(handler, "stream", None)
+    for attached in handlers:
+        if attached is handler:
+            return attached
+        if (
+            stream is not None
+            and type(attached) is type(handler)
+            and getattr(attached, "stream", None) is stream
+        ):
+            return attached
+    return None
 
 
 def set_log_level(level: str, logger_name: str = "bedrock_swarm") -> None:
@@ -51,9 +229,12 @@ def set_log_level(level: str, logger_name: str = "bedrock_swarm") -> None:
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         logger_name: Name of the logger to configure. Defaults to bedrock_swarm.
+
+    Raises:
+        ValueError: If the level name is unknown
     """
     logger = logging.getLogger(logger_name)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(_get_level(level))
 
 
 def get_logger(name: str) -> logging.Logger:
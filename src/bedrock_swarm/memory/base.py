@@ -1,11 +1,19 @@
 """Base memory implementation for managing conversation history and shared state."""
 
+import sys
+import threading
+from bisect import bisect_left, bisect_right
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import compress, islice
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Message:
     """Message class for storing conversation history."""
 
@@ -17,23 +25,101 @@ class Message:
 
 
 class SharedState:
-    """Simple shared state between agents."""
+    """Simple shared state between agents.
+
+    Keys are guarded by a fixed set of striped locks, so agents working on
+    different keys do not contend on a single lock.
+    """
+
+    __slots__ = ("_data", "_stripes", "_pending")
+
+    _STRIPE_COUNT = 16  # Must be a power of two
 
     def __init__(self) -> None:
         """Initialize shared state."""
         self._data: Dict[str, Any] = {}
+        self._stripes = tuple(threading.Lock() for _ in range(self._STRIPE_COUNT))
+        # Key -> lock held while get_or_set computes that key's value
+        self._pending: Dict[str, threading.RLock] = {}
+
+    def _lock(self, key: str) -> threading.Lock:
+        """Get the lock stripe guarding a key."""
+        return self._stripes[hash(key) & (self._STRIPE_COUNT - 1)]
 
     def set(self, key: str, value: Any) -> None:
         """Set a value in shared state."""
-        self._data[key] = value
+        with self._lock(key):
+            self._data[key] = value
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a value from shared state."""
-        return self._data.get(key, default)
+        with self._lock(key):
+            return self._data.get(key, default)
+
+    def get_or_set(self, key: str, factory: Callable[[], Any]) -> Any:
+        """Get a value, computing and storing it first if it is missing.
+
+        The factory runs at most once per key, even when several agents ask
+        for the same missing key concurrently. It runs without holding a
+        stripe lock, so it may itself read or write other keys.
+
+        Args:
+            key: Key to look up
+            factory: Callable producing the value when the key is missing
+
+        Returns:
+            The stored value
+        """
+        stripe = self._lock(key)
+        with stripe:
+            if key in self._data:
+                return self._data[key]
+            pending = self._pending.setdefault(key, threading.RLock())
+
+        # Only one thread computes a given key; the others wait here and then
+        # find the stored value
+        with pending:
+            try:
+                with stripe:
+                    if key in self._data:
+                        return self._data[key]
+                value = factory()
+                with stripe:
+                    self._data[key] = value
+                return value
+            finally:
+                # Drop the entry even if the factory raised, unless a later
+                # caller already replaced it
+                with stripe:
+                    if self._pending.get(key) is pending:
+                        del self._pending[key]
 
     def clear(self) -> None:
         """Clear all shared state."""
-        self._data.clear()
+        for lock in self._stripes:
+            lock.acquire()
+        try:
+            self._data.clear()
+        finally:
+            for lock in self._stripes:
+                lock.release()
+
+
+def _tail(messages: Sequence[Message], limit: int) -> List[Message]:
+    """Copy the last ``limit`` messages by iterating from the end.
+
+    Args:
+        messages: Messages in chronological order
+        limit: Maximum number of messages to copy
+
+    Returns:
+        Up to ``limit`` trailing messages in chronological order
+    """
+    if limit <= 0:
+        return []
+    tail = list(islice(reversed(messages), limit))
+    tail.reverse()
+    return tail
 
 
 class BaseMemory:
@@ -47,6 +133,18 @@ class BaseMemory:
         """
         raise NotImplementedError
 
+    def add_messages(self, messages: Sequence[Message]) -> None:
+        """Add several messages to memory in order.
+
+        Backends that store messages remotely can override this with a single
+        bulk write instead of one round-trip per message.
+
+        Args:
+            messages: Messages to add
+        """
+        for message in messages:
+            self.add_message(message)
+
     def get_messages(self, thread_id: Optional[str] = None) -> List[Message]:
         """Get messages from memory.
 
@@ -58,6 +156,25 @@ class BaseMemory:
         """
         raise NotImplementedError
 
+    def get_recent_messages(
+        self, limit: int, thread_id: Optional[str] = None
+    ) -> List[Message]:
+        """Get the most recent messages.
+
+        Implementations may override this to avoid materializing the full
+        history when only the tail is needed.
+
+        Args:
+            limit: Maximum number of messages to return
+            thread_id: Optional thread ID to filter messages
+
+        Returns:
+            Up to ``limit`` most recent messages in chronological order
+        """
+        if limit <= 0:
+            return []
+        return self.get_messages(thread_id)[-limit:]
+
     def get_last_message(self, thread_id: Optional[str] = None) -> Optional[Message]:
         """Get the most recent message.
 
@@ -81,29 +198,104 @@ class SimpleMemory(BaseMemory):
         """Initialize SimpleMemory.
 
         Args:
-            max_size: Maximum number of messages to store per thread
+            max_size: Maximum number of messages to store per thread (zero or
+                less stores none)
         """
-        self._messages: Dict[str, List[Message]] = {}  # thread_id -> messages
+        self._messages: Dict[str, Deque[Message]] = {}  # thread_id -> messages
+        # All messages across threads, kept in timestamp order, with parallel
+        # columns for the fields that cross-thread queries compare
+        self._global: List[Message] = []
+        self._global_keys: List[datetime] = []
+        self._global_threads: List[str] = []
+        self._global_types: List[Optional[str]] = []
+        self._global_roles: List[str] = []
+        # (thread_id, metadata type) -> messages of that type in the thread
+        self._by_type: Dict[Tuple[str, str], Deque[Message]] = {}
+        # (thread_id, role) -> messages from that role in the thread
+        self._by_role: Dict[Tuple[str, str], Deque[Message]] = {}
         self._max_size = max_size
         self.shared_state = SharedState()
 
     def add_message(self, message: Message) -> None:
         """Add a message to memory.
 
-        If max_size is reached, oldest messages are removed.
+        If max_size is reached, oldest messages are removed. With a max_size
+        of zero or less no messages are kept.
 
         Args:
             message: Message to add
         """
-        thread_id = message.thread_id or "default"
-        if thread_id not in self._messages:
-            self._messages[thread_id] = []
+        if self._max_size <= 0:
+            # Nothing is kept, so nothing may reach the indexes either
+            return
 
-        self._messages[thread_id].append(message)
+        thread_id = message.thread_id or "default"
+        role = message.role
+        metadata = message.metadata
+        message_type = metadata.get("type") if metadata else None
+
+        thread_messages = self._messages.get(thread_id)
+        if thread_messages is None:
+            # Bounded deque evicts the oldest message once max_size is reached
+            thread_messages = self._messages[thread_id] = deque(maxlen=self._max_size)
+        elif len(thread_messages) == thread_messages.maxlen:
+            self._evict(thread_id, thread_messages[0])
+        thread_messages.append(message)
+
+        if message_type is not None:
+            by_type = self._by_type.get((thread_id, message_type))
+            if by_type is None:
+                by_type = self._by_type[(thread_id, message_type)] = deque()
+            by_type.append(message)
+
+        by_role = self._by_role.get((thread_id, role))
+        if by_role is None:
+            by_role = self._by_role[(thread_id, role)] = deque()
+        by_role.append(message)
+
+        timestamp = message.timestamp
+        keys = self._global_keys
+        if not keys or timestamp >= keys[-1]:
+            self._global.append(message)
+            keys.append(timestamp)
+            self._global_threads.append(thread_id)
+            self._global_types.append(message_type)
+            self._global_roles.append(role)
+            return
+
+        index = bisect_right(keys, timestamp)
+        self._global.insert(index, message)
+        keys.insert(index, timestamp)
+        self._global_threads.insert(index, thread_id)
+        self._global_types.insert(index, message_type)
+        self._global_roles.insert(index, role)
+
+    def _evict(self, thread_id: str, message: Message) -> None:
+        """Remove a thread's oldest message from the secondary indexes.
+
+        The message's type and role are read from the global columns, which
+        record them as they were when the message was added, so the indexes
+        stay consistent even if the message was changed since.
 
-        # Enforce size limit per thread
-        if len(self._messages[thread_id]) > self._max_size:
-            self._messages[thread_id] = self._messages[thread_id][-self._max_size :]
+        Args:
+            thread_id: Thread the message belongs to
+            message: Message about to be evicted from the thread
+        """
+        index = bisect_left(self._global_keys, message.timestamp)
+        while self._global[index] is not message:
+            index += 1
+
+        message_type = self._global_types[index]
+        if message_type is not None:
+            # The thread's oldest message is also the oldest of its type
+            self._by_type[(thread_id, message_type)].popleft()
+        self._by_role[(thread_id, self._global_roles[index])].popleft()
+
+        del self._global[index]
+        del self._global_keys[index]
+        del self._global_threads[index]
+        del self._global_types[index]
+        del self._global_roles[index]
 
     def get_messages(self, thread_id: Optional[str] = None) -> List[Message]:
         """Get messages from memory.
@@ -114,14 +306,69 @@ class SimpleMemory(BaseMemory):
         Returns:
             List of messages in chronological order
         """
+        return list(self._view(thread_id))
+
+    def _view(self, thread_id: Optional[str]) -> Sequence[Message]:
+        """Get the stored messages without copying them.
+
+        Internal callers that only read the result use this instead of
+        get_messages. The returned sequence must not be modified.
+
+        Args:
+            thread_id: Optional thread ID to filter messages
+
+        Returns:
+            Messages in chronological order
+        """
         if thread_id:
-            return self._messages.get(thread_id, []).copy()
+            return self._messages.get(thread_id, ())
+
+        # If no thread_id, all messages are already kept sorted by timestamp
+        return self._global
+
+    def get_recent_messages(
+        self, limit: int, thread_id: Optional[str] = None
+    ) -> List[Message]:
+        """Get the most recent messages.
+
+        Only the requested tail is read, walking back from the newest message.
+
+        Args:
+            limit: Maximum number of messages to return
+            thread_id: Optional thread ID to filter messages
+
+        Returns:
+            Up to ``limit`` most recent messages in chronological order
+        """
+        return _tail(self._view(thread_id), limit)
+
+    def get_messages_between(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        thread_id: Optional[str] = None,
+    ) -> List[Message]:
+        """Get messages with timestamps in the range [start, end).
+
+        Args:
+            start: Earliest timestamp to include, or None for no lower bound
+            end: Timestamp to stop before, or None for no upper bound
+            thread_id: Optional thread ID to filter messages
 
-        # If no thread_id, return all messages sorted by timestamp
-        all_messages = []
-        for messages in self._messages.values():
-            all_messages.extend(messages)
-        return sorted(all_messages, key=lambda m: m.timestamp)
+        Returns:
+            List of matching messages in chronological order
+        """
+        keys = self._global_keys
+        lo = bisect_left(keys, start) if start is not None else 0
+        hi = bisect_left(keys, end) if end is not None else len(keys)
+        if not thread_id:
+            return self._global[lo:hi]
+
+        return [
+            msg
+            for msg, tid in zip(self._global[lo:hi], self._global_threads[lo:hi])
+            if tid == thread_id
+        ]
 
     def get_last_message(self, thread_id: Optional[str] = None) -> Optional[Message]:
         """Get the most recent message.
@@ -132,7 +379,7 @@ class SimpleMemory(BaseMemory):
         Returns:
             Most recent message or None if no messages
         """
-        messages = self.get_messages(thread_id)
+        messages = self._view(thread_id)
         return messages[-1] if messages else None
 
     def get_messages_by_type(
@@ -147,11 +394,34 @@ class SimpleMemory(BaseMemory):
         Returns:
             List of messages of the specified type in chronological order
         """
-        messages = self.get_messages(thread_id)
+        if thread_id:
+            return list(self._by_type.get((thread_id, message_type), ()))
+
+        return [
+            msg
+            for msg, msg_type in zip(self._global, self._global_types)
+            if msg_type == message_type
+        ]
+
+    def get_messages_by_role(
+        self, role: str, thread_id: Optional[str] = None
+    ) -> List[Message]:
+        """Get messages from a specific role.
+
+        Args:
+            role: Role of messages to retrieve ('user', 'assistant', or 'system')
+            thread_id: Optional thread ID to filter messages
+
+        Returns:
+            List of messages from the specified role in chronological order
+        """
+        if thread_id:
+            return list(self._by_role.get((thread_id, role), ()))
+
         return [
             msg
-            for msg in messages
-            if msg.metadata and msg.metadata.get("type") == message_type
+            for msg, msg_role in zip(self._global, self._global_roles)
+            if msg_role == role
         ]
 
     def get_tool_results(
@@ -166,10 +436,12 @@ class SimpleMemory(BaseMemory):
         Returns:
             List of tool result messages in chronological order
         """
-        tool_results = self.get_messages_by_type("tool_result", thread_id)
-        if limit:
-            return tool_results[-limit:]
-        return tool_results
+        if not thread_id:
+            tool_results = self.get_messages_by_type("tool_result")
+            return tool_results[-limit:] if limit else tool_results
+
+        indexed = self._by_type.get((thread_id, "tool_result"), ())
+        return _tail(indexed, limit) if limit else list(indexed)
 
     def get_conversation_summary(
         self, thread_id: Optional[str] = None, limit: int = 5
@@ -183,39 +455,47 @@ class SimpleMemory(BaseMemory):
         Returns:
             List of message pairs (user/assistant) with their content
         """
-        messages = self.get_messages(thread_id)
-        summary = []
-
-        # Process messages from newest to oldest, up to limit pairs
-        i = len(messages) - 1
-        while i >= 0 and len(summary) < limit:
-            msg = messages[i]
+        if limit <= 0:
+            return []
 
+        summary: List[Dict[str, Any]] = []
+        # Walk back from the newest message, remembering the one that followed
+        reply: Optional[Message] = None
+        for msg in reversed(self._view(thread_id)):
             if msg.role == "user":
                 # Look ahead for assistant response
-                if i + 1 < len(messages) and messages[i + 1].role == "assistant":
-                    summary.insert(
-                        0,
+                if reply is not None and reply.role == "assistant":
+                    summary.append(
                         {
                             "user": msg.content,
-                            "assistant": messages[i + 1].content,
+                            "assistant": reply.content,
                             "has_tool_calls": bool(
-                                messages[i + 1].metadata
-                                and messages[i + 1].metadata.get("type")
-                                == "tool_call_intent"
+                                reply.metadata
+                                and reply.metadata.get("type") == "tool_call_intent"
                             ),
-                        },
+                        }
                     )
                 else:
                     # No assistant response found
-                    summary.insert(0, {"user": msg.content, "assistant": None})
-            i -= 1
+                    summary.append({"user": msg.content, "assistant": None})
+
+                if len(summary) == limit:
+                    break
+            reply = msg
 
-        return summary[-limit:]
+        summary.reverse()
+        return summary
 
     def clear(self) -> None:
         """Clear all messages from memory."""
         self._messages.clear()
+        self._global.clear()
+        self._global_keys.clear()
+        self._global_threads.clear()
+        self._global_types.clear()
+        self._global_roles.clear()
+        self._by_type.clear()
+        self._by_role.clear()
         self.shared_state.clear()
 
     def clear_thread(self, thread_id: str) -> None:
@@ -226,6 +506,16 @@ class SimpleMemory(BaseMemory):
         """
         if thread_id in self._messages:
             del self._messages[thread_id]
+            keep = [tid != thread_id for tid in self._global_threads]
+            self._global = list(compress(self._global, keep))
+            self._global_keys = list(compress(self._global_keys, keep))
+            self._global_threads = list(compress(self._global_threads, keep))
+            self._global_types = list(compress(self._global_types, keep))
+            self._global_roles = list(compress(self._global_roles, keep))
+            for key in [key for key in self._by_type if key[0] == thread_id]:
+                del self._by_type[key]
+            for key in [key for key in self._by_role if key[0] == thread_id]:
+                del self._by_role[key]
 
     def get_thread_ids(self) -> List[str]:
         """Get list of all thread IDs in memory.
@@ -4,9 +4,19 @@ Models for interacting with Amazon Bedrock.
 This module contains the base model class and implementations for specific Bedrock models.
 """
 
+from typing import Any
+
 from .base import BedrockModel
 from .claude import ClaudeModel
 from .factory import ModelFactory
-from .titan import TitanModel
 
 __all__ = ["BedrockModel", "ClaudeModel", "TitanModel", "ModelFactory"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import TitanModel on first access rather than with the package."""
+    if name == "TitanModel":
+        from .titan import TitanModel
+
+        return TitanModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
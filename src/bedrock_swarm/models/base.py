@@ -1,46 +1,269 @@
 """Base classes for Bedrock model implementations."""
 
 import abc
-import json
+import asyncio
+import functools
 import logging
+import random
+import re
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
 
+import boto3
 from botocore.client import BaseClient
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
+from botocore.exceptions import HTTPClientError
 
+from .. import serialization
 from ..exceptions import ModelInvokeError, ResponseParsingError
-from ..types import AgentResponse
+from ..types import AgentResponse, TokenUsage, ToolCall
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
+def _tool_call_response(parsed: Dict[str, Any]) -> Optional[AgentResponse]:
+    """Accept a parsed tool call response if it contains tool calls."""
+    return cast(AgentResponse, parsed) if parsed.get("tool_calls") else None
+
+
+def _message_response(parsed: Dict[str, Any]) -> Optional[AgentResponse]:
+    """Normalize a parsed message response."""
+    return {"type": "message", "content": parsed.get("content", "")}
+
+
+# Inference latency profiles accepted by Bedrock's performanceConfigLatency
+LATENCY_MODES = frozenset(["standard", "optimized"])
+
+# Bedrock runtime APIs a model can be invoked through
+APIS = frozenset(["invoke", "converse"])
+
+# Handlers for JSON responses, keyed by their "type" field
+_RESPONSE_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Optional[AgentResponse]]] = {
+    "tool_call": _tool_call_response,
+    "message": _message_response,
+}
+
+# Cheap pre-filter for text that could hold a response object: only spans that
+# declare one of the handled types are worth scanning or parsing
+_RESPONSE_TYPE_RE = re.compile(
+    r'"type"\s*:\s*"(?:%s)"' % "|".join(map(re.escape, _RESPONSE_HANDLERS))
+)
+
+
+def _iter_json_objects(text: str) -> Iterator[str]:
+    """Yield balanced top-level ``{...}`` spans embedded in text.
+
+    Walks the text once, tracking brace depth and string/escape state so that
+    braces inside JSON strings are ignored. Text between objects is skipped
+    with str.find rather than character by character.
+
+    Args:
+        text: Text that may contain JSON objects
+
+    Yields:
+        Candidate JSON object substrings, in order of appearance
+    """
+    start = text.find("{")
+    while start != -1:
+        depth = 0
+        in_string = False
+        escape = False
+        end = -1
+        for i in range(start, len(text)):
+            char = text[i]
+            if in_string:
+                if escape:
+                    escape = False
+                elif char == "\\":
+                    escape = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    end = i
+                    break
+        if end == -1:
+            return  # Unbalanced; nothing further can close
+        yield text[start : end + 1]
+        start = text.find("{", end + 1)
+
+
+def _parse_response_object(candidate: str) -> Optional[AgentResponse]:
+    """Parse a JSON response object and dispatch it on its type field."""
+    if not _RESPONSE_TYPE_RE.search(candidate):
+        return None
+    try:
+        parsed = serialization.loads(candidate)
+    except serialization.JSONDecodeError:
+        return None
+    if not isinstance(parsed, dict):
+        return None
+    response_type = parsed.get("type")
+    handler = (
+        _RESPONSE_HANDLERS.get(response_type)
+        if isinstance(response_type, str)
+        else None
+    )
+    return handler(parsed) if handler else None
+
+
+def _finish_tool_calls(
+    tool_inputs: Dict[int, List[str]], tool_calls: List[ToolCall]
+) -> None:
+    """Fill in tool call arguments from their streamed input JSON.
+
+    Args:
+        tool_inputs: Input JSON fragments for each tool use block, in the order
+            the blocks were opened
+        tool_calls: Tool calls opened for those blocks
+
+    Raises:
+        ResponseParsingError: If the streamed input is not valid JSON
+    """
+    for call, fragments in zip(tool_calls, tool_inputs.values()):
+        if not fragments:
+            continue
+        try:
+            call["function"]["arguments"] = serialization.loads("".join(fragments))
+        except serialization.JSONDecodeError as e:
+            raise ResponseParsingError(f"Error parsing tool input: {str(e)}")
+
+
+# Error codes of transient failures that are retried with backoff. Clients
+# are created with botocore's own retries disabled, so these must cover what
+# its default policy would have retried.
+_RETRYABLE_ERROR_CODES = frozenset(
+    [
+        "ThrottlingException",
+        "ServiceUnavailableException",
+        "InternalServerException",
+        "ModelNotReadyException",
+    ]
+)
+
+# Connection failures and timeouts (EndpointConnectionError,
+# ConnectTimeoutError, ReadTimeoutError, ConnectionClosedError, ...)
+_RETRYABLE_CONNECTION_ERRORS = (BotocoreConnectionError, HTTPClientError)
+
+# Everything the invoke loops hand to _retry_wait
+_RETRY_CANDIDATES = (ClientError,) + _RETRYABLE_CONNECTION_ERRORS
+
+
+def _retry_after(error: ClientError) -> Optional[float]:
+    """Read the Retry-After header from a retryable error, if present."""
+    headers = error.response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
+    try:
+        return float(headers["retry-after"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 class BedrockModel(abc.ABC):
     """Base class for Bedrock model implementations."""
 
-    def __init__(self, model_id: str):
+    # Whether format_request accepts tool schemas for native tool use
+    SUPPORTS_TOOLS = False
+
+    def __init__(self, model_id: str, latency: str = "standard", api: str = "invoke"):
         """Initialize the model.
 
         Args:
             model_id: The Bedrock model ID to use
+            latency: Inference latency profile, "standard" or "optimized".
+                Latency-optimized inference is only available for some models
+                and regions; unsupported requests fall back to standard.
+            api: Bedrock runtime API to call, "invoke" for InvokeModel with
+                the model's native request format or "converse" for the
+                model-agnostic Converse API
+
+        Raises:
+            ValueError: If the latency profile or API is not supported
         """
         self._model_id = model_id
         self._config: Dict[str, Any] = {
             "max_tokens": 4096,  # Default maximum tokens
             "default_tokens": 2048,  # Default response length
         }
+        self.set_config({"latency": latency, "api": api})
 
     def get_model_id(self) -> str:
         """Get the Bedrock model ID."""
         return self._model_id
 
+    def supports_tools(self) -> bool:
+        """Check whether invoke can send tool schemas as native tools.
+
+        Returns:
+            True for models with native tool use in their request format, and
+            for any model configured for the Converse API
+        """
+        return self.SUPPORTS_TOOLS or self._config["api"] == "converse"
+
+    @classmethod
+    def make_client(
+        cls,
+        region: Optional[str] = None,
+        max_connections: int = 50,
+        session: Optional[boto3.Session] = None,
+        endpoint_url: Optional[str] = None,
+    ) -> BaseClient:
+        """Create a Bedrock runtime client suited to concurrent invocations.
+
+        This is the supported way to construct the client passed to invoke.
+        The client is thread-safe and should be shared: its connection pool is
+        sized for concurrent streaming calls, TCP keepalive keeps connections
+        warm between turns, and botocore's own retries are disabled because
+        invoke already retries throttling, transient service errors and
+        connection failures with jittered backoff.
+
+        Args:
+            region: Optional AWS region (defaults to the session's region)
+            max_connections: Maximum number of pooled HTTP connections
+            session: Optional boto3 session to create the client from
+            endpoint_url: Optional custom endpoint URL
+
+        Returns:
+            Bedrock runtime client
+        """
+        config = Config(
+            max_pool_connections=max_connections,
+            retries={"max_attempts": 0},
+            tcp_keepalive=True,
+        )
+        return (session or boto3.Session()).client(
+            "bedrock-runtime",
+            region_name=region,
+            endpoint_url=endpoint_url,
+            config=config,
+        )
+
     def set_config(self, config: Dict[str, Any]) -> None:
         """Set model-specific configuration.
 
         Args:
             config: Configuration dictionary with model settings
+
+        Raises:
+            ValueError: If the latency profile or API is not supported
         """
+        if "latency" in config and config["latency"] not in LATENCY_MODES:
+            raise ValueError(
+                f"Invalid latency '{config['latency']}'. "
+                f"Must be one of: {', '.join(sorted(LATENCY_MODES))}"
+            )
+        if "api" in config and config["api"] not in APIS:
+            raise ValueError(
+                f"Invalid API '{config['api']}'. "
+                f"Must be one of: {', '.join(sorted(APIS))}"
+            )
         self._config.update(config)
 
     def validate_token_count(self, max_tokens: Optional[int] = None) -> int:
@@ -75,6 +298,7 @@ class BedrockModel(abc.ABC):
         system: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Format a request for the model.
 
@@ -83,12 +307,93 @@ class BedrockModel(abc.ABC):
             system: Optional system prompt
             temperature: Temperature for response generation (0.0 to 1.0)
             max_tokens: Maximum number of tokens to generate
+            tools: Optional tool schemas (as returned by BaseTool.get_schema)
+                for models that support native tool use
 
         Returns:
             Formatted request dictionary
         """
         pass
 
+    def format_converse_request(
+        self,
+        message: str,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Format the arguments of a Converse API request.
+
+        Converse requests have the same shape for every model, so unlike
+        format_request this is not model-specific.
+
+        Args:
+            message: The message to send to the model
+            system: Optional system prompt
+            temperature: Temperature for response generation (0.0 to 1.0)
+            max_tokens: Maximum number of tokens to generate
+            tools: Optional tool schemas (as returned by BaseTool.get_schema)
+
+        Returns:
+            Keyword arguments for converse_stream, without the model ID
+
+        Raises:
+            ValueError: If max_tokens exceeds the model's limit
+        """
+        request: Dict[str, Any] = {
+            "messages": [{"role": "user", "content": [{"text": message}]}],
+            "inferenceConfig": {
+                "temperature": temperature,
+                "maxTokens": self.validate_token_count(max_tokens),
+            },
+        }
+        if system:
+            request["system"] = [{"text": system}]
+        if tools:
+            request["toolConfig"] = {
+                "tools": [
+                    {
+                        "toolSpec": {
+                            "name": schema["name"],
+                            "description": schema["description"],
+                            "inputSchema": {"json": schema["parameters"]},
+                        }
+                    }
+                    for schema in tools
+                ]
+            }
+        return request
+
+    def _build_request(
+        self,
+        message: str,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Format a request for the configured API.
+
+        Returns:
+            Converse arguments or the model-specific request body
+        """
+        if self._config["api"] == "converse":
+            return self.format_converse_request(
+                message, system, temperature, max_tokens, tools
+            )
+
+        # Only pass tools when given, so models without native tool use
+        # keep their format_request signature
+        options: Dict[str, Any] = {"tools": tools} if tools else {}
+        return self.format_request(
+            message=message,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **options,
+        )
+
     def process_response(self, response: Dict[str, Any]) -> AgentResponse:
         """Process a response from this specific model.
 
@@ -103,37 +408,78 @@ class BedrockModel(abc.ABC):
         """
         try:
             # Extract content from response (implementation specific)
+            usage: Dict[str, int] = {}
+            tool_calls: List[ToolCall] = []
             try:
-                content = self._extract_content(response)
+                if "stream" in response:
+                    content = "".join(
+                        self._iter_converse_content(response, usage, tool_calls)
+                    )
+                else:
+                    content = self._extract_content(response, usage, tool_calls)
             except ResponseParsingError:
                 # Return empty message for invalid responses
                 return {"type": "message", "content": ""}
 
-            # Try to parse as JSON if it looks like JSON
-            if content.startswith("{") and content.endswith("}"):
-                try:
-                    parsed = json.loads(content)
-
-                    # Validate response format
-                    if parsed.get("type") == "tool_call" and parsed.get("tool_calls"):
-                        return parsed
-                    elif parsed.get("type") == "message":
-                        return {"type": "message", "content": parsed.get("content", "")}
-                except json.JSONDecodeError:
-                    pass
-
-            # If not valid JSON or not proper format, return as message
-            return {"type": "message", "content": content}
+            result: AgentResponse
+            if tool_calls:
+                # Native tool use blocks need no parsing of the text content
+                result = {"type": "tool_call", "tool_calls": tool_calls}
+            else:
+                result = self._parse_content(content)
+            if usage:
+                # Token counts come with the stream, so no extra call is needed
+                result["usage"] = cast(TokenUsage, usage)
+            return result
 
         except Exception as e:
             raise ResponseParsingError(f"Error processing response: {str(e)}")
 
+    def _parse_content(self, content: str) -> AgentResponse:
+        """Turn extracted content into a message or tool call response.
+
+        Args:
+            content: Text extracted from the model response
+
+        Returns:
+            Parsed response; plain text becomes a message
+        """
+        start = content.find("{")
+        end = content.rfind("}")
+        if (
+            start != -1
+            and end > start
+            and _RESPONSE_TYPE_RE.search(content, start, end)
+        ):
+            # Try the outermost braces first: this covers bare JSON and a
+            # single object wrapped in extra text with one parse
+            result = _parse_response_object(content[start : end + 1])
+            if result is not None:
+                return result
+
+            # Otherwise look for an object among several brace spans
+            if start > 0 or end < len(content) - 1:
+                for candidate in _iter_json_objects(content):
+                    result = _parse_response_object(candidate)
+                    if result is not None:
+                        return result
+
+        # If not valid JSON or not proper format, return as message
+        return {"type": "message", "content": content}
+
     @abc.abstractmethod
-    def _extract_content(self, response: Dict[str, Any]) -> str:
+    def _extract_content(
+        self,
+        response: Dict[str, Any],
+        usage: Optional[Dict[str, int]] = None,
+        tool_calls: Optional[List[ToolCall]] = None,
+    ) -> str:
         """Extract the content from a model response.
 
         Args:
             response: Raw response from the model
+            usage: Optional dictionary to fill with the reported token usage
+            tool_calls: Optional list to fill with native tool use requests
 
         Returns:
             Extracted content as string
@@ -143,20 +489,227 @@ class BedrockModel(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def _iter_content(
+        self, response: Dict[str, Any], usage: Optional[Dict[str, int]] = None
+    ) -> Iterator[str]:
+        """Yield pieces of content from a streaming model response as they arrive.
+
+        Args:
+            response: Raw streaming response from the model
+            usage: Optional dictionary to fill with the reported token usage
+
+        Yields:
+            Content fragments in the order they were received
+
+        Raises:
+            ResponseParsingError: If a chunk cannot be parsed
+        """
+        pass
+
+    def _iter_converse_content(
+        self,
+        response: Dict[str, Any],
+        usage: Optional[Dict[str, int]] = None,
+        tool_calls: Optional[List[ToolCall]] = None,
+    ) -> Iterator[str]:
+        """Yield text deltas from a Converse API response stream.
+
+        Converse events arrive already deserialized and have the same shape for
+        every model, so no per-chunk JSON parsing is needed.
+
+        Args:
+            response: Raw response from converse_stream
+            usage: Optional dictionary to fill with the reported token usage
+            tool_calls: Optional list to fill with tool use requests
+
+        Yields:
+            Text deltas in the order they were received
+
+        Raises:
+            ResponseParsingError: If an event cannot be interpreted
+        """
+        # Streamed input JSON fragments for each open tool use block, by index
+        tool_inputs: Dict[int, List[str]] = {}
+        for event in response["stream"]:
+            try:
+                if "contentBlockDelta" in event:
+                    block = event["contentBlockDelta"]
+                    delta = block["delta"]
+                    if "toolUse" in delta:
+                        tool_inputs[block["contentBlockIndex"]].append(
+                            delta["toolUse"]["input"]
+                        )
+                        continue
+                    text = delta["text"]
+                elif "contentBlockStart" in event:
+                    block = event["contentBlockStart"]
+                    tool = block["start"].get("toolUse")
+                    if tool is not None:
+                        tool_inputs[block["contentBlockIndex"]] = []
+                        if tool_calls is not None:
+                            tool_calls.append(
+                                {
+                                    "id": tool["toolUseId"],
+                                    "type": "function",
+                                    "function": {"name": tool["name"], "arguments": {}},
+                                }
+                            )
+                    continue
+                else:
+                    if usage is not None and "metadata" in event:
+                        counts = event["metadata"]["usage"]
+                        usage["input_tokens"] = counts["inputTokens"]
+                        usage["output_tokens"] = counts["outputTokens"]
+                    continue
+            except (KeyError, TypeError, AttributeError) as e:
+                raise ResponseParsingError(f"Invalid stream event: {str(e)}")
+            yield text
+
+        if tool_calls:
+            _finish_tool_calls(tool_inputs, tool_calls)
+
+    @staticmethod
+    def _record_usage(chunk: Dict[str, Any], usage: Dict[str, int]) -> None:
+        """Copy token counts from Bedrock's invocation metrics on a stream chunk.
+
+        Bedrock attaches these metrics to the final chunk of every model's stream.
+
+        Args:
+            chunk: Parsed stream chunk
+            usage: Dictionary updated in place with input/output token counts
+        """
+        metrics = chunk.get("amazon-bedrock-invocationMetrics")
+        if metrics:
+            usage["input_tokens"] = metrics.get("inputTokenCount", 0)
+            usage["output_tokens"] = metrics.get("outputTokenCount", 0)
+
+    def _serialize_request(self, request: Dict[str, Any]) -> bytes:
+        """Serialize a request body for Bedrock.
+
+        Args:
+            request: Request dictionary as returned by format_request
+
+        Returns:
+            JSON encoded request body
+        """
+        return serialization.dumps(request)
+
+    def _prepare_call(
+        self, client: BaseClient, request: Dict[str, Any]
+    ) -> Tuple[Callable[..., Dict[str, Any]], Dict[str, Any], str]:
+        """Select the client method and arguments for a request.
+
+        Args:
+            client: Bedrock client
+            request: Request body, or Converse arguments when the model is
+                configured for the Converse API
+
+        Returns:
+            Client method, its keyword arguments and the name of the latency
+            argument
+        """
+        latency = self._config.get("latency", "standard")
+        if self._config.get("api") == "converse":
+            options: Dict[str, Any] = {"modelId": self.get_model_id(), **request}
+            if latency != "standard":
+                options["performanceConfig"] = {"latency": latency}
+            return client.converse_stream, options, "performanceConfig"
+
+        # Serialize once; retries resend the same bytes
+        options = {
+            "modelId": self.get_model_id(),
+            "body": self._serialize_request(request),
+        }
+        if latency != "standard":
+            options["performanceConfigLatency"] = latency
+        return (
+            client.invoke_model_with_response_stream,
+            options,
+            "performanceConfigLatency",
+        )
+
+    @staticmethod
+    def _retry_wait(
+        error: Exception,
+        attempt: int,
+        max_retries: int,
+        options: Dict[str, Any],
+        latency_option: str,
+        delay: float,
+        initial_delay: float,
+        max_delay: float,
+    ) -> Tuple[float, float]:
+        """Decide how to retry a failed call.
+
+        Throttled or temporarily unavailable requests, and connection
+        failures, wait for the server's Retry-After hint when one is given,
+        bounded by max_delay, and otherwise for a decorrelated-jitter delay,
+        so concurrent callers do not retry in lockstep. Rejected
+        latency-optimized requests are retried at once with standard latency.
+
+        Args:
+            error: ClientError or botocore connection error raised by the call
+            attempt: Zero-based number of the failed attempt
+            max_retries: Maximum number of retries
+            options: Call arguments, updated in place for the retry
+            latency_option: Name of the latency argument in options
+            delay: Previous jittered delay in seconds
+            initial_delay: Initial delay in seconds
+            max_delay: Upper bound on any wait in seconds
+
+        Returns:
+            Seconds to wait before retrying and the new jittered delay
+
+        Raises:
+            ModelInvokeError: If the error should not be retried
+        """
+        error_code = (
+            error.response["Error"]["Code"] if isinstance(error, ClientError) else None
+        )
+        if attempt < max_retries - 1:
+            if error_code == "ValidationException" and latency_option in options:
+                # Not every model/region supports latency-optimized inference
+                logger.debug(
+                    "Latency-optimized inference rejected, retrying with standard"
+                )
+                options.pop(latency_option)
+                return 0.0, delay
+            if error_code in _RETRYABLE_ERROR_CODES or isinstance(
+                error, _RETRYABLE_CONNECTION_ERRORS
+            ):
+                # Decorrelated jitter backoff
+                delay = min(max_delay, random.uniform(initial_delay, delay * 3))
+                wait = _retry_after(error) if isinstance(error, ClientError) else None
+                if wait is None:
+                    wait = delay
+                else:
+                    # Never trust the server hint beyond the configured bound
+                    wait = min(max(wait, 0.0), max_delay)
+                logger.debug(
+                    f"{error_code or type(error).__name__}. Waiting {wait:.1f}s "
+                    f"before retry {attempt + 1}/{max_retries}"
+                )
+                return wait, delay
+        raise ModelInvokeError(f"Error invoking model: {str(error)}")
+
     def _invoke_with_retry(
         self,
         client: BaseClient,
         request: Dict[str, Any],
         max_retries: int = 5,
-        initial_delay: float = 1.0,
+        initial_delay: float = 0.1,
+        max_delay: float = 20.0,
     ) -> Dict[str, Any]:
-        """Invoke model with exponential backoff retry.
+        """Invoke model with jittered exponential backoff retry.
 
         Args:
             client: Bedrock client
-            request: Request body
+            request: Request body, or Converse arguments when the model is
+                configured for the Converse API
             max_retries: Maximum number of retries
             initial_delay: Initial delay in seconds
+            max_delay: Upper bound on the jittered delay in seconds
 
         Returns:
             Model response
@@ -164,30 +717,71 @@ class BedrockModel(abc.ABC):
         Raises:
             ModelInvokeError: If all retries fail
         """
+        call, options, latency_option = self._prepare_call(client, request)
         delay = initial_delay
         last_error = None
 
         for attempt in range(max_retries):
             try:
-                response = client.invoke_model_with_response_stream(
-                    modelId=self.get_model_id(),
-                    body=json.dumps(request),
+                return call(**options)
+            except _RETRY_CANDIDATES as e:
+                last_error = e
+                wait, delay = self._retry_wait(
+                    e,
+                    attempt,
+                    max_retries,
+                    options,
+                    latency_option,
+                    delay,
+                    initial_delay,
+                    max_delay,
                 )
-                return response
+                if wait:
+                    time.sleep(wait)
+
+        raise ModelInvokeError(f"Max retries exceeded: {str(last_error)}")
+
+    async def _ainvoke_with_retry(
+        self,
+        client: BaseClient,
+        request: Dict[str, Any],
+        max_retries: int = 5,
+        initial_delay: float = 0.1,
+        max_delay: float = 20.0,
+    ) -> Dict[str, Any]:
+        """Invoke model with retry without blocking the running event loop.
+
+        Behaves like _invoke_with_retry, but each blocking boto3 call runs in
+        the loop's default executor and backoff waits use asyncio.sleep, so
+        no thread is held while a throttled request waits.
+
+        Raises:
+            ModelInvokeError: If all retries fail
+        """
+        loop = asyncio.get_running_loop()
+        call, options, latency_option = self._prepare_call(client, request)
+        delay = initial_delay
+        last_error = None
 
-            except ClientError as e:
+        for attempt in range(max_retries):
+            try:
+                return await loop.run_in_executor(
+                    None, functools.partial(call, **options)
+                )
+            except _RETRY_CANDIDATES as e:
                 last_error = e
-                if (
-                    e.response["Error"]["Code"] == "ThrottlingException"
-                    and attempt < max_retries - 1
-                ):
-                    logger.debug(
-                        f"Rate limited. Waiting {delay:.1f}s before retry {attempt + 1}/{max_retries}"
-                    )
-                    time.sleep(delay)
-                    delay *= 2  # Exponential backoff
-                    continue
-                raise ModelInvokeError(f"Error invoking model: {str(e)}")
+                wait, delay = self._retry_wait(
+                    e,
+                    attempt,
+                    max_retries,
+                    options,
+                    latency_option,
+                    delay,
+                    initial_delay,
+                    max_delay,
+                )
+                if wait:
+                    await asyncio.sleep(wait)
 
         raise ModelInvokeError(f"Max retries exceeded: {str(last_error)}")
 
@@ -198,21 +792,29 @@ class BedrockModel(abc.ABC):
         system: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
     ) -> AgentResponse:
         """Invoke the model with a message.
 
+        Use a client from make_client, shared across invocations.
+
         This defines the high-level flow:
-        1. Format request (model-specific)
+        1. Format request (model-specific, or Converse arguments)
         2. Call Bedrock with retry
         3. Process response (model-specific)
+
+        When tools are given (for models with SUPPORTS_TOOLS, or any model on
+        the Converse API), they are sent through the native tool use API and
+        tool use blocks in the response are returned as a tool call response.
+
+        Raises:
+            ModelInvokeError: If the model cannot be invoked
+            ResponseParsingError: If the response cannot be processed
         """
         try:
-            # Format request (model-specific)
-            request = self.format_request(
-                message=message,
-                system=system,
-                temperature=temperature,
-                max_tokens=max_tokens,
+            # Format request for the configured API
+            request = self._build_request(
+                message, system, temperature, max_tokens, tools
             )
 
             # Call Bedrock with retry
@@ -221,5 +823,76 @@ class BedrockModel(abc.ABC):
             # Process response
             return self.process_response(response)
 
+        except (ModelInvokeError, ResponseParsingError):
+            # Already carry their context; wrapping again only nests messages
+            raise
         except Exception as e:
             raise ModelInvokeError(f"Error invoking model: {str(e)}")
+
+    async def ainvoke(
+        self,
+        client: BaseClient,
+        message: str,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> AgentResponse:
+        """Invoke the model without blocking the running event loop.
+
+        Blocking boto3 calls and stream reads run in the loop's default
+        executor, and throttling backoff waits with asyncio.sleep, so several
+        invocations can be awaited concurrently (e.g. with asyncio.gather)
+        without holding a thread per waiting request. Arguments and errors are
+        the same as for invoke.
+        """
+        try:
+            request = self._build_request(
+                message, system, temperature, max_tokens, tools
+            )
+            response = await self._ainvoke_with_retry(client, request)
+
+            # Reading the stream blocks on the network as well
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.process_response, response)
+
+        except (ModelInvokeError, ResponseParsingError):
+            # Already carry their context; wrapping again only nests messages
+            raise
+        except Exception as e:
+            raise ModelInvokeError(f"Error invoking model: {str(e)}")
+
+    def stream(
+        self,
+        client: BaseClient,
+        message: str,
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Invoke the model and yield response content as it arrives.
+
+        Unlike invoke, the content is not parsed into a message or tool call,
+        so callers can process it while the rest of the response is still
+        being received.
+
+        Yields:
+            Content fragments in the order they were received
+
+        Raises:
+            ModelInvokeError: If the model cannot be invoked
+            ResponseParsingError: If a chunk cannot be parsed
+        """
+        try:
+            request = self._build_request(message, system, temperature, max_tokens)
+            response = self._invoke_with_retry(client, request)
+        except (ModelInvokeError, ResponseParsingError):
+            # Already carry their context; wrapping again only nests messages
+            raise
+        except Exception as e:
+            raise ModelInvokeError(f"Error invoking model: {str(e)}")
+
+        if "stream" in response:
+            yield from self._iter_converse_content(response)
+        else:
+            yield from self._iter_content(response)
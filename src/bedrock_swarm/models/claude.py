@@ -1,18 +1,75 @@
 """Claude model implementation."""
 
-import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
+from .. import serialization
 from ..exceptions import ResponseParsingError
-from .base import BedrockModel
+from ..types import ToolCall
+from .base import BedrockModel, _finish_tool_calls
+
+ANTHROPIC_VERSION = "bedrock-2023-05-31"
+
+# Serialized request body as built by format_request, with only the per-call
+# values left to fill in
+_REQUEST_TEMPLATE = (
+    b'{"anthropic_version":"' + ANTHROPIC_VERSION.encode() + b'",'
+    b'"max_tokens":%b,"temperature":%b,'
+    b'"messages":[{"role":"user","content":%b}]}'
+)
+_REQUEST_KEYS = frozenset(
+    ["anthropic_version", "max_tokens", "temperature", "messages"]
+)
+
+# Stream events that never carry text, tool use or invocation metrics. Chunks
+# naming one of these (and not content_block_delta or tool_use) are skipped
+# without being parsed.
+_SKIPPED_EVENT_MARKERS = (
+    b'"message_start"',
+    b'"content_block_start"',
+    b'"content_block_stop"',
+    b'"message_delta"',
+    b'"ping"',
+)
+
+_TEXT_DELTA_HEAD = b'{"type":"content_block_delta"'
+_TEXT_KEY = b'"text":"'
+
+
+def _scan_delta_text(raw: bytes) -> Optional[str]:
+    """Read the text of a compact text delta chunk without parsing it.
+
+    Text deltas are small, flat and always end with the text value, so the
+    value can be sliced straight out of the bytes. Anything that does not
+    match that shape exactly, or whose text contains escapes, returns None so
+    the caller falls back to a full parse.
+
+    Args:
+        raw: Raw chunk bytes
+
+    Returns:
+        Delta text, or None if the chunk needs a full parse
+    """
+    if not raw.startswith(_TEXT_DELTA_HEAD) or raw[-3:] != b'"}}':
+        return None
+    start = raw.find(_TEXT_KEY) + len(_TEXT_KEY)
+    if start < len(_TEXT_KEY):
+        return None
+    text = raw[start:-3]
+    if b'"' in text or b"\\" in text:
+        return None
+    return text.decode()
 
 
 class ClaudeModel(BedrockModel):
     """Implementation for Claude 3.5 models."""
 
+    MODEL_ID = "us.anthropic.claude-3-5-sonnet-20241022-v2:0"
+    ANTHROPIC_VERSION = ANTHROPIC_VERSION
+    SUPPORTS_TOOLS = True
+
     def get_model_id(self) -> str:
         """Get the Bedrock model ID."""
-        return "us.anthropic.claude-3-5-sonnet-20241022-v2:0"
+        return self.MODEL_ID
 
     def format_request(
         self,
@@ -20,6 +77,7 @@ class ClaudeModel(BedrockModel):
         system: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Format a request for Claude.
 
@@ -28,6 +86,8 @@ class ClaudeModel(BedrockModel):
             system: Optional system prompt
             temperature: Temperature for response generation (0.0 to 1.0)
             max_tokens: Maximum number of tokens to generate
+            tools: Optional tool schemas, sent as Claude's native tool
+                definitions
 
         Returns:
             Formatted request dictionary
@@ -35,18 +95,64 @@ class ClaudeModel(BedrockModel):
         # Combine system prompt and message if provided
         content = f"{system}\n\n{message}" if system else message
 
-        return {
-            "anthropic_version": "bedrock-2023-05-31",
+        request: Dict[str, Any] = {
+            "anthropic_version": self.ANTHROPIC_VERSION,
             "max_tokens": max_tokens or 4096,
             "temperature": temperature,
             "messages": [{"role": "user", "content": content}],
         }
+        if tools:
+            request["tools"] = [
+                {
+                    "name": schema["name"],
+                    "description": schema["description"],
+                    "input_schema": schema["parameters"],
+                }
+                for schema in tools
+            ]
+        return request
+
+    def _serialize_request(self, request: Dict[str, Any]) -> bytes:
+        """Serialize a request body for Claude.
+
+        Requests shaped like those from format_request are rendered from a
+        pre-encoded template, so only the per-call values are serialized.
+        Anything else falls back to full serialization.
 
-    def _extract_content(self, response: Dict[str, Any]) -> str:
+        Args:
+            request: Request dictionary as returned by format_request
+
+        Returns:
+            JSON encoded request body
+        """
+        messages = request.get("messages")
+        if (
+            request.keys() == _REQUEST_KEYS
+            and request["anthropic_version"] == ANTHROPIC_VERSION
+            and isinstance(messages, list)
+            and len(messages) == 1
+            and messages[0].keys() == {"role", "content"}
+            and messages[0]["role"] == "user"
+        ):
+            return _REQUEST_TEMPLATE % (
+                serialization.dumps(request["max_tokens"]),
+                serialization.dumps(request["temperature"]),
+                serialization.dumps(messages[0]["content"]),
+            )
+        return super()._serialize_request(request)
+
+    def _extract_content(
+        self,
+        response: Dict[str, Any],
+        usage: Optional[Dict[str, int]] = None,
+        tool_calls: Optional[List[ToolCall]] = None,
+    ) -> str:
         """Extract content from Claude response.
 
         Args:
             response: Raw response from Claude
+            usage: Optional dictionary to fill with the reported token usage
+            tool_calls: Optional list to fill with native tool use requests
 
         Returns:
             Extracted content as string
@@ -54,15 +160,89 @@ class ClaudeModel(BedrockModel):
         Raises:
             ResponseParsingError: If content cannot be extracted
         """
-        content = []
+        return "".join(self._iter_content(response, usage, tool_calls))
+
+    def _iter_content(
+        self,
+        response: Dict[str, Any],
+        usage: Optional[Dict[str, int]] = None,
+        tool_calls: Optional[List[ToolCall]] = None,
+    ) -> Iterator[str]:
+        """Yield text deltas from a Claude response stream as they arrive.
+
+        Tool use blocks are not yielded. When a tool_calls list is given, each
+        one is added to it as a tool call once its streamed input is complete.
+
+        Args:
+            response: Raw streaming response from Claude
+            usage: Optional dictionary to fill with the reported token usage
+            tool_calls: Optional list to fill with native tool use requests
+
+        Yields:
+            Text deltas in the order they were received
+
+        Raises:
+            ResponseParsingError: If a chunk cannot be parsed
+        """
+        loads = serialization.loads
+        scan_text = serialization.orjson is None
+        # Streamed input JSON fragments for each open tool use block, by index
+        tool_inputs: Dict[int, List[str]] = {}
         for event in response["body"]:
             try:
-                chunk = json.loads(event.get("chunk").get("bytes").decode())
-                if chunk.get("type") == "content_block_delta":
-                    content.append(chunk["delta"]["text"])
-            except json.JSONDecodeError as e:
+                raw = event["chunk"]["bytes"]
+                text = _scan_delta_text(raw) if scan_text else None
+                if text is None:
+                    if (
+                        b"content_block_delta" not in raw
+                        and b'"tool_use"' not in raw
+                        and any(marker in raw for marker in _SKIPPED_EVENT_MARKERS)
+                    ):
+                        continue
+                    # Parse the UTF-8 bytes directly, without a decode
+                    chunk = loads(raw)
+                    if chunk.get("type") != "content_block_delta":
+                        if chunk.get("type") == "content_block_start":
+                            self._start_tool_call(chunk, tool_inputs, tool_calls)
+                        elif usage is not None:
+                            self._record_usage(chunk, usage)
+                        continue
+                    delta = chunk["delta"]
+                    if delta.get("type") == "input_json_delta":
+                        tool_inputs[chunk["index"]].append(delta["partial_json"])
+                        continue
+                    text = delta["text"]
+            except serialization.JSONDecodeError as e:
                 raise ResponseParsingError(f"Error parsing chunk: {str(e)}")
-            except (KeyError, AttributeError) as e:
+            except (KeyError, TypeError, AttributeError) as e:
                 raise ResponseParsingError(f"Invalid chunk format: {str(e)}")
+            yield text
+
+        if tool_calls:
+            _finish_tool_calls(tool_inputs, tool_calls)
 
-        return "".join(content)
+    @staticmethod
+    def _start_tool_call(
+        chunk: Dict[str, Any],
+        tool_inputs: Dict[int, List[str]],
+        tool_calls: Optional[List[ToolCall]],
+    ) -> None:
+        """Open a tool call for a tool use content block.
+
+        Args:
+            chunk: Parsed content_block_start chunk
+            tool_inputs: Input JSON fragments for each open tool use block
+            tool_calls: Optional list of tool calls to add the new call to
+        """
+        block = chunk["content_block"]
+        if block["type"] != "tool_use":
+            return
+        tool_inputs[chunk["index"]] = []
+        if tool_calls is not None:
+            tool_calls.append(
+                {
+                    "id": block["id"],
+                    "type": "function",
+                    "function": {"name": block["name"], "arguments": block["input"]},
+                }
+            )
@@ -1,16 +1,18 @@
 """Factory for creating Bedrock model implementations."""
 
-from typing import Any, Dict, Type
+import importlib
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Type, Union
 
 from .base import BedrockModel
-from .claude import ClaudeModel
-from .titan import TitanModel
 
-# Registry of supported models, their implementations, and configurations
-BEDROCK_MODEL_REGISTRY = {
+# Registry of supported models, their implementations, and configurations.
+# Implementations may be given as "module:Class" paths, which are imported on
+# first use so unused model families cost nothing at import time.
+BEDROCK_MODEL_REGISTRY: Dict[str, Dict[str, Dict[str, Any]]] = {
     "us.anthropic.claude-3-5-sonnet": {
         "20241022-v2:0": {
-            "class": ClaudeModel,
+            "class": "bedrock_swarm.models.claude:ClaudeModel",
             "config": {
                 "max_tokens": 200000,  # Claude 3 Sonnet context window
                 "default_tokens": 4096,
@@ -19,7 +21,7 @@ BEDROCK_MODEL_REGISTRY = {
     },
     "amazon.titan-text-express": {
         "v1": {
-            "class": TitanModel,
+            "class": "bedrock_swarm.models.titan:TitanModel",
             "config": {
                 "max_tokens": 8000,  # Maximum context window
                 "default_tokens": 2048,  # Default response length
@@ -28,7 +30,7 @@ BEDROCK_MODEL_REGISTRY = {
     },
     "amazon.titan-text-lite": {
         "v1": {
-            "class": TitanModel,
+            "class": "bedrock_swarm.models.titan:TitanModel",
             "config": {
                 "max_tokens": 4000,
                 "default_tokens": 2048,
@@ -37,7 +39,7 @@ BEDROCK_MODEL_REGISTRY = {
     },
     "amazon.titan-text-premier": {
         "v1:0": {
-            "class": TitanModel,
+            "class": "bedrock_swarm.models.titan:TitanModel",
             "config": {
                 "max_tokens": 3072,  # As per validation error encountered
                 "default_tokens": 2048,
@@ -52,6 +54,69 @@ class ModelFactory:
 
     _model_registry = BEDROCK_MODEL_REGISTRY
 
+    # Dispatch table of full model ID -> registry entry, kept in sync by register_model
+    _model_index: Dict[str, Dict[str, Any]] = {}
+
+    # Character trie over registered families; the "" key marks a node that
+    # completes a family
+    _family_trie: Dict[str, Any] = {}
+
+    @classmethod
+    def _build_index(cls) -> None:
+        """Rebuild the model ID dispatch table and family trie from the registry."""
+        cls._model_index = {
+            f"{family}-{version}": model_info
+            for family, versions in cls._model_registry.items()
+            for version, model_info in versions.items()
+        }
+        trie: Dict[str, Any] = {}
+        for family in cls._model_registry:
+            node = trie
+            for char in family:
+                node = node.setdefault(char, {})
+            node[""] = family
+        cls._family_trie = trie
+
+    @classmethod
+    def _match_family(cls, model_id: str) -> Optional[str]:
+        """Find the longest registered family that prefixes a model ID.
+
+        Args:
+            model_id: The Bedrock model ID
+
+        Returns:
+            The most specific matching family, or None if no family matches
+        """
+        node = cls._family_trie
+        family = None
+        for char in model_id:
+            child = node.get(char)
+            if child is None:
+                break
+            node = child
+            family = node.get("", family)
+        return family
+
+    @staticmethod
+    def _resolve_class(model_info: Dict[str, Any]) -> Type[BedrockModel]:
+        """Get the implementation class of a registry entry.
+
+        A "module:Class" path is imported and the class is stored back in the
+        entry, so the import machinery only runs once.
+
+        Args:
+            model_info: Registry entry for a model version
+
+        Returns:
+            Model implementation class
+        """
+        model_class = model_info["class"]
+        if isinstance(model_class, str):
+            module_name, _, class_name = model_class.partition(":")
+            model_class = getattr(importlib.import_module(module_name), class_name)
+            model_info["class"] = model_class
+        return model_class
+
     @classmethod
     def create_model(cls, model_id: str) -> BedrockModel:
         """Create a model implementation for the given model ID.
@@ -65,41 +130,36 @@ class ModelFactory:
         Raises:
             ValueError: If the model ID is not supported
         """
-        # Find matching model family
-        family = next(
-            (f for f in cls._model_registry.keys() if model_id.startswith(f)), None
-        )
-
-        if not family:
+        # Fast path: exact model ID lookup
+        model_info = cls._model_index.get(model_id)
+        if model_info is not None:
+            model = cls._resolve_class(model_info)(model_id)
+            model.set_config(model_info["config"])
+            return model
+
+        # Find matching model family to report a useful error
+        family = cls._match_family(model_id)
+        if family is None:
             supported = ", ".join(cls._model_registry.keys())
             raise ValueError(
                 f"Unsupported model family. Model ID must start with one of: {supported}"
             )
 
-        # Extract version (everything after the family name and a hyphen)
-        version = model_id[len(family) + 1 :]
-
-        # Get model implementation
-        family_registry = cls._model_registry[family]
-        if version not in family_registry:
-            versions = ", ".join(family_registry.keys())
-            raise ValueError(
-                f"Unsupported version '{version}' for model family '{family}'. "
-                f"Supported versions: {versions}"
-            )
-
-        # Create model instance with its configuration
-        model_info = family_registry[version]
-        model = model_info["class"](model_id)
-        model.set_config(model_info["config"])
-        return model
+        version = model_id[len(family) :]
+        if version.startswith("-"):
+            version = version[1:]
+        versions = ", ".join(cls._model_registry[family].keys())
+        raise ValueError(
+            f"Unsupported version '{version}' for model family '{family}'. "
+            f"Supported versions: {versions}"
+        )
 
     @classmethod
     def register_model(
         cls,
         family: str,
         version: str,
-        model_class: Type[BedrockModel],
+        model_class: Union[str, Type[BedrockModel]],
         config: Dict[str, Any],
     ) -> None:
         """Register a new model implementation.
@@ -107,18 +167,27 @@ class ModelFactory:
         Args:
             family: Model family (e.g., "us.anthropic.claude-3-5-sonnet")
             version: Model version (e.g., "20241022-v2:0")
-            model_class: Model implementation class
+            model_class: Model implementation class, or its "module:Class"
+                path to import on first use
             config: Model configuration (max_tokens, default_tokens, etc.)
         """
         if family not in cls._model_registry:
             cls._model_registry[family] = {}
         cls._model_registry[family][version] = {"class": model_class, "config": config}
+        cls._build_index()
 
     @classmethod
-    def get_supported_models(cls) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    def get_supported_models(cls) -> Mapping[str, Dict[str, Dict[str, Any]]]:
         """Get all supported models.
 
         Returns:
-            Dictionary of supported model families, versions, and their configurations
+            Read-only view of the supported model families, versions, and their
+            configurations. Use register_model to add models.
         """
-        return cls._model_registry.copy()
+        for versions in cls._model_registry.values():
+            for model_info in versions.values():
+                cls._resolve_class(model_info)
+        return MappingProxyType(cls._model_registry)
+
+
+ModelFactory._build_index()
@@ -1,17 +1,24 @@
 """Titan model implementation."""
 
-import json
 import logging
-from typing import Any, Dict, Optional
-
-from bedrock_swarm.exceptions import ModelInvokeError
+from typing import Any, Dict, Iterator, List, Optional
 
+from .. import serialization
 from ..exceptions import ResponseParsingError
+from ..types import ToolCall
 from .base import BedrockModel
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Serialized request body as built by format_request, with only the per-call
+# values left to fill in
+_REQUEST_TEMPLATE = (
+    b'{"inputText":%b,"textGenerationConfig":{"temperature":%b,'
+    b'"topP":1,"maxTokenCount":%b,"stopSequences":[]}}'
+)
+_CONFIG_KEYS = frozenset(["temperature", "topP", "maxTokenCount", "stopSequences"])
+
 
 class TitanModel(BedrockModel):
     """Implementation for Amazon Titan models."""
@@ -22,6 +29,7 @@ class TitanModel(BedrockModel):
         system: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """Format a request for Titan.
 
@@ -30,13 +38,18 @@ class TitanModel(BedrockModel):
             system: Optional system prompt
             temperature: Temperature for response generation (0.0 to 1.0)
             max_tokens: Maximum number of tokens to generate
+            tools: Not supported; Titan has no native tool use
 
         Returns:
             Formatted request dictionary
 
         Raises:
-            ValueError: If max_tokens exceeds the model's limit or temperature is invalid
+            ValueError: If max_tokens exceeds the model's limit, temperature is
+                invalid or tools are given
         """
+        if tools:
+            raise ValueError("Titan models do not support native tool use")
+
         # Validate temperature
         if not 0.0 <= temperature <= 1.0:
             raise ValueError("Temperature must be between 0.0 and 1.0")
@@ -58,11 +71,46 @@ class TitanModel(BedrockModel):
         }
         return request
 
-    def _extract_content(self, response: Dict[str, Any]) -> str:
+    def _serialize_request(self, request: Dict[str, Any]) -> bytes:
+        """Serialize a request body for Titan.
+
+        Requests shaped like those from format_request are rendered from a
+        pre-encoded template, so only the per-call values are serialized.
+        Anything else falls back to full serialization.
+
+        Args:
+            request: Request dictionary as returned by format_request
+
+        Returns:
+            JSON encoded request body
+        """
+        config = request.get("textGenerationConfig")
+        if (
+            request.keys() == {"inputText", "textGenerationConfig"}
+            and isinstance(config, dict)
+            and config.keys() == _CONFIG_KEYS
+            and config["topP"] == 1
+            and config["stopSequences"] == []
+        ):
+            return _REQUEST_TEMPLATE % (
+                serialization.dumps(request["inputText"]),
+                serialization.dumps(config["temperature"]),
+                serialization.dumps(config["maxTokenCount"]),
+            )
+        return super()._serialize_request(request)
+
+    def _extract_content(
+        self,
+        response: Dict[str, Any],
+        usage: Optional[Dict[str, int]] = None,
+        tool_calls: Optional[List[ToolCall]] = None,
+    ) -> str:
         """Extract content from Titan response.
 
         Args:
             response: Raw response from Titan
+            usage: Optional dictionary to fill with the reported token usage
+            tool_calls: Unused; Titan has no native tool use
 
         Returns:
             Extracted content as string
@@ -70,42 +118,43 @@ class TitanModel(BedrockModel):
         Raises:
             ResponseParsingError: If content cannot be extracted
         """
-        content = []
         logger.debug("Processing response: %s", response)
 
-        for event in response["body"]:
-            try:
-                chunk = json.loads(event.get("chunk", {}).get("bytes", b"{}").decode())
-                logger.debug("Processing chunk: %s", chunk)
-                if "outputText" in chunk:
-                    content.append(chunk["outputText"])
-            except json.JSONDecodeError as e:
-                raise ResponseParsingError(f"Error parsing chunk: {str(e)}")
-            except (KeyError, AttributeError) as e:
-                raise ResponseParsingError(f"Invalid chunk format: {str(e)}")
-
-        # Join and clean up the content
-        return " ".join(part.strip() for part in content).strip()
+        # Join and clean up the content; map with the unbound str.strip avoids
+        # running a generator frame per chunk
+        return " ".join(map(str.strip, self._iter_content(response, usage))).strip()
 
-    def invoke(self, message: str, **kwargs: Any) -> Dict[str, Any]:
-        """Invoke the model with a message.
+    def _iter_content(
+        self, response: Dict[str, Any], usage: Optional[Dict[str, int]] = None
+    ) -> Iterator[str]:
+        """Yield output text from a Titan response stream as it arrives.
 
         Args:
-            message: The message to send to the model
-            **kwargs: Additional arguments to pass to format_request
+            response: Raw streaming response from Titan
+            usage: Optional dictionary to fill with the reported token usage
 
-        Returns:
-            Model response
+        Yields:
+            Output text in the order it was received
 
         Raises:
-            ModelInvokeError: If there is an error invoking the model
+            ResponseParsingError: If a chunk cannot be parsed
         """
-        try:
-            request = self.format_request(message, **kwargs)
-            response = self.client.invoke_model_with_response_stream(
-                modelId=self.get_model_id(),
-                body=json.dumps(request).encode(),
-            )
-            return self.process_response(response)
-        except Exception as e:
-            raise ModelInvokeError(f"Error invoking model: {str(e)}")
+        loads = serialization.loads
+        # Checked once per stream rather than once per chunk
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for event in response["body"]:
+            try:
+                # Parse the UTF-8 bytes directly, without a decode
+                chunk = loads(event["chunk"]["bytes"])
+                if debug:
+                    logger.debug("Processing chunk: %s", chunk)
+                if usage is not None:
+                    self._record_usage(chunk, usage)
+                if "outputText" not in chunk:
+                    continue
+                text = chunk["outputText"]
+            except serialization.JSONDecodeError as e:
+                raise ResponseParsingError(f"Error parsing chunk: {str(e)}")
+            except (KeyError, TypeError, AttributeError) as e:
+                raise ResponseParsingError(f"Invalid chunk format: {str(e)}")
+            yield text
@@ -0,0 +1,48 @@
+"""JSON serialization helpers.
+
+Uses orjson when it is installed (``pip install bedrock-swarm[fast]``) and falls
+back to the standard library ``json`` module otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError, so callers can
+# keep catching the standard library exception with either backend.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: JSON document as str or UTF-8 encoded bytes
+
+    Returns:
+        Deserialized object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
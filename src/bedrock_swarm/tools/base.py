@@ -4,7 +4,11 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict
 
 from ..exceptions import ToolError
-from .validation import validate_tool_parameters, validate_tool_schema
+from .validation import (
+    check_tool_parameters,
+    create_parameter_validator,
+    validate_tool_schema,
+)
 
 
 class BaseTool(ABC):
@@ -17,6 +21,10 @@ class BaseTool(ABC):
     - execute: Method to execute the tool
     """
 
+    # Built on first use; subclasses are not required to call __init__
+    _schema: Dict[str, Any]
+    _parameter_validator: Any
+
     def __init__(self, name: str, description: str) -> None:
         """Initialize the tool and validate schema.
 
@@ -26,8 +34,7 @@ class BaseTool(ABC):
         """
         self._name = name
         self._description = description
-        schema = self.get_schema()
-        validate_tool_schema(self.name, schema)
+        validate_tool_schema(self.name, self.schema)
 
     @property
     @abstractmethod
@@ -50,6 +57,27 @@ class BaseTool(ABC):
         """
         pass
 
+    @property
+    def schema(self) -> Dict[str, Any]:
+        """Get the tool schema, built by get_schema once per instance.
+
+        Returns:
+            Dict[str, Any]: Tool schema
+        """
+        try:
+            return self._schema
+        except AttributeError:
+            self._schema = self.get_schema()
+            return self._schema
+
+    def _get_parameter_validator(self) -> Any:
+        """Get the validator for the tool's parameters, created on first use."""
+        try:
+            return self._parameter_validator
+        except AttributeError:
+            self._parameter_validator = create_parameter_validator(self.schema)
+            return self._parameter_validator
+
     def execute(self, **kwargs: Any) -> str:
         """Execute the tool with given parameters.
 
@@ -63,7 +91,7 @@ class BaseTool(ABC):
             ToolError: If tool execution fails
         """
         try:
-            validate_tool_parameters(self.get_schema(), **kwargs)
+            check_tool_parameters(self._get_parameter_validator(), kwargs)
             return self._execute_impl(**kwargs)
         except Exception as e:
             if isinstance(e, ToolError):
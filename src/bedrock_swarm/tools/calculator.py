@@ -1,9 +1,76 @@
 """Calculator tool for basic arithmetic."""
 
-from typing import Any, Dict
+import ast
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, Type, Union
 
 from .base import BaseTool
 
+# Only allow basic arithmetic for safety. Translating an expression through
+# this table deletes every allowed character, so anything left over is invalid.
+_DISALLOWED_TABLE = str.maketrans("", "", "0123456789+-*/(). ")
+
+# Operators reachable with the allowed characters
+_BINARY_OPERATORS: Dict[Type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPERATORS: Dict[Type[ast.unaryop], Callable[[Any], Any]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_expression(expression: str) -> ast.expr:
+    """Parse an arithmetic expression, caching repeated expressions.
+
+    Args:
+        expression: Arithmetic expression containing only allowed characters
+
+    Returns:
+        Root node of the parsed expression
+
+    Raises:
+        SyntaxError: If the expression is not valid Python syntax
+    """
+    # Leading whitespace is an indentation error outside of eval()
+    return ast.parse(expression.strip(), mode="eval").body
+
+
+def _evaluate(node: ast.expr) -> Union[int, float]:
+    """Evaluate a parsed arithmetic expression.
+
+    Only numeric literals and the operators in _BINARY_OPERATORS and
+    _UNARY_OPERATORS are accepted, so nothing else in the language is
+    reachable.
+
+    Args:
+        node: Expression node to evaluate
+
+    Returns:
+        Value of the expression
+
+    Raises:
+        ValueError: If the expression uses unsupported syntax
+    """
+    if isinstance(node, ast.BinOp):
+        binary = _BINARY_OPERATORS.get(type(node.op))
+        if binary is not None:
+            return binary(_evaluate(node.left), _evaluate(node.right))
+    elif isinstance(node, ast.UnaryOp):
+        unary = _UNARY_OPERATORS.get(type(node.op))
+        if unary is not None:
+            return unary(_evaluate(node.operand))
+    elif isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    raise ValueError(f"unsupported syntax {ast.dump(node)}")
+
 
 class CalculatorTool(BaseTool):
     """Simple calculator tool for basic arithmetic."""
@@ -61,14 +128,11 @@ class CalculatorTool(BaseTool):
         Raises:
             ValueError: If expression is invalid
         """
-        # Only allow basic arithmetic for safety
-        allowed = set("0123456789+-*/(). ")
-        if not all(c in allowed for c in expression):
+        if expression.translate(_DISALLOWED_TABLE):
             raise ValueError("Invalid characters in expression")
 
         try:
-            # Evaluate the expression safely
-            result = eval(expression, {"__builtins__": {}})
+            result = _evaluate(_parse_expression(expression))
             return str(result)
         except Exception as e:
             raise ValueError(f"Invalid expression: {str(e)}")
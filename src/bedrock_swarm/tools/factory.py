@@ -1,6 +1,8 @@
 """Tool factory for creating tool instances."""
 
-from typing import Dict, Type
+import threading
+from types import MappingProxyType
+from typing import Dict, Mapping, Type
 
 from ..exceptions import ToolError
 from .base import BaseTool
@@ -11,6 +13,10 @@ class ToolFactory:
     """Factory for creating tool instances."""
 
     _tool_types: Dict[str, Type[BaseTool]] = {}
+    _tool_types_view: Mapping[str, Type[BaseTool]] = MappingProxyType(_tool_types)
+
+    # Process-wide lock making registration check-and-set atomic across threads
+    _lock = threading.Lock()
 
     @classmethod
     def register_tool_type(cls, tool_type: Type[BaseTool]) -> None:
@@ -23,9 +29,10 @@ class ToolFactory:
             ToolError: If tool type is already registered
         """
         name = tool_type.__name__
-        if name in cls._tool_types:
-            raise ToolError(f"Tool type {name} already registered")
-        cls._tool_types[name] = tool_type
+        with cls._lock:
+            if name in cls._tool_types:
+                raise ToolError(f"Tool type {name} already registered")
+            cls._tool_types[name] = tool_type
 
     @classmethod
     def create_tool(cls, tool_type: str, **kwargs: str) -> BaseTool:
@@ -46,18 +53,19 @@ class ToolFactory:
         return cls._tool_types[tool_type](**kwargs)
 
     @classmethod
-    def get_tool_types(cls) -> Dict[str, Type[BaseTool]]:
+    def get_tool_types(cls) -> Mapping[str, Type[BaseTool]]:
         """Get registered tool types.
 
         Returns:
-            Dict mapping tool type names to tool classes
+            Read-only live view mapping tool type names to tool classes
         """
-        return dict(cls._tool_types)
+        return cls._tool_types_view
 
     @classmethod
     def clear(cls) -> None:
         """Clear all registered tool types."""
-        cls._tool_types.clear()
+        with cls._lock:
+            cls._tool_types.clear()
 
 
 # Register built-in tools
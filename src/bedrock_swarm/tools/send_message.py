@@ -1,7 +1,8 @@
 """Tool for sending messages between agents."""
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from ..tools.base import BaseTool
 
@@ -14,11 +15,15 @@ logger = logging.getLogger(__name__)
 class SendMessageTool(BaseTool):
     """Tool for sending messages between agents."""
 
+    # Maximum number of responses kept when response caching is enabled
+    _CACHE_MAX_SIZE = 128
+
     def __init__(
         self,
         valid_recipients: Optional[List[str]] = None,
         description: Optional[str] = None,
         agency: Optional["Agency"] = None,
+        cache: bool = False,
     ) -> None:
         """Initialize the send message tool.
 
@@ -26,11 +31,20 @@ class SendMessageTool(BaseTool):
             valid_recipients: Optional list of valid recipient names
             description: Optional tool description
             agency: Optional reference to the agency
+            cache: Whether to reuse the recipient's earlier response when the
+                same message is sent to it again from the same thread, instead
+                of asking the recipient again
         """
         self._name = "SendMessage"
         self._description = description or "Send a message to another agent"
         self._valid_recipients = valid_recipients or []
+        # Set view of the recipients for constant-time membership checks
+        self._recipient_set = frozenset(self._valid_recipients)
         self._agency = agency
+        # (recipient, thread ID, message) -> response, least recently used first
+        self._response_cache: Optional["OrderedDict[Tuple[str, str, str], str]"] = (
+            OrderedDict() if cache else None
+        )
 
     @property
     def name(self) -> str:
@@ -77,7 +91,7 @@ class SendMessageTool(BaseTool):
         Raises:
             ValueError: If recipient is not valid
         """
-        if recipient not in self._valid_recipients:
+        if recipient not in self._recipient_set:
             raise ValueError(f"Invalid recipient: {recipient}")
 
         # Get thread from kwargs
@@ -85,13 +99,27 @@ class SendMessageTool(BaseTool):
         if not thread:
             raise ValueError("No thread provided")
 
+        cache = self._response_cache
+        if cache is not None:
+            key = (recipient, thread.id, message)
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached
+
         # Process message through recipient's thread
         recipient_agent = self._agency.get_agent(recipient)
         if not recipient_agent:
             raise ValueError(f"Recipient agent {recipient} not found")
 
-        return self._agency.get_completion(
+        response = self._agency.get_completion(
             message=message,
             recipient_agent=recipient_agent,
             thread_id=thread.id,
         )
+
+        if cache is not None:
+            cache[key] = response
+            if len(cache) > self._CACHE_MAX_SIZE:
+                cache.popitem(last=False)
+        return response
@@ -2,13 +2,101 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
-from zoneinfo import ZoneInfo, available_timezones
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Optional
 
 from .base import BaseTool
 
+if TYPE_CHECKING:
+    from zoneinfo import ZoneInfo
+
 logger = logging.getLogger(__name__)
 
+# Output format for reported times
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S %Z"
+
+# Common aliases, keyed by upper-case name
+_TZ_ALIASES = {
+    "EST": "America/New_York",
+    "EDT": "America/New_York",
+    "CST": "America/Chicago",
+    "CDT": "America/Chicago",
+    "MST": "America/Denver",
+    "MDT": "America/Denver",
+    "PST": "America/Los_Angeles",
+    "PDT": "America/Los_Angeles",
+    "JST": "Asia/Tokyo",
+    "GMT": "UTC",
+}
+
+
+@lru_cache(maxsize=None)
+def _available_timezones() -> FrozenSet[str]:
+    """Get the names of all available timezones.
+
+    available_timezones walks the timezone database on every call, so the
+    result is computed on first use and then reused.
+
+    Returns:
+        Set of valid IANA timezone names
+    """
+    # zoneinfo is imported on first use so importing the tools package does
+    # not load it
+    from zoneinfo import available_timezones
+
+    return frozenset(available_timezones())
+
+
+@lru_cache(maxsize=256)
+def _normalize_timezone(timezone: str) -> str:
+    """Normalize a timezone name, caching the result for repeated names.
+
+    Args:
+        timezone: Timezone name to normalize
+
+    Returns:
+        Normalized timezone name
+
+    Raises:
+        ValueError: If timezone is invalid
+    """
+    # Try alias first (alias keys are upper case)
+    upper = timezone.upper()
+    alias = _TZ_ALIASES.get(upper)
+    if alias is not None:
+        return alias
+
+    # Try as is, before computing any variations
+    timezones = _available_timezones()
+    if timezone in timezones:
+        return timezone
+
+    # Try common variations
+    for var in (upper, timezone.lower(), timezone.title(), f"Etc/{timezone}"):
+        if var in timezones:
+            return var
+
+    raise ValueError(f"Invalid timezone: {timezone}")
+
+
+@lru_cache(maxsize=128)
+def _zoneinfo(name: str) -> "ZoneInfo":
+    """Get the ZoneInfo for a timezone name, sharing instances across calls.
+
+    ZoneInfo only keeps strong references to its 8 most recently used zones,
+    so cycling through more names than that reparses the tzdata file each
+    time.
+
+    Args:
+        name: Normalized timezone name
+
+    Returns:
+        ZoneInfo for the timezone
+    """
+    from zoneinfo import ZoneInfo
+
+    return ZoneInfo(name)
+
 
 class CurrentTimeTool(BaseTool):
     """Tool for getting current time and calculating future times."""
@@ -47,7 +135,7 @@ class CurrentTimeTool(BaseTool):
                 "properties": {
                     "timezone": {
                         "type": "string",
-                        "description": "Timezone to get time in (e.g. 'UTC', 'US/Pacific'). Defaults to local timezone.",
+                        "description": "Timezone to get time in (e.g. 'UTC', 'US/Pacific', or 'local'). Defaults to local timezone.",
                     },
                     "minutes_offset": {
                         "type": "integer",
@@ -70,42 +158,7 @@ class CurrentTimeTool(BaseTool):
         Raises:
             ValueError: If timezone is invalid
         """
-        # Common aliases
-        aliases = {
-            "EST": "America/New_York",
-            "EDT": "America/New_York",
-            "CST": "America/Chicago",
-            "CDT": "America/Chicago",
-            "MST": "America/Denver",
-            "MDT": "America/Denver",
-            "PST": "America/Los_Angeles",
-            "PDT": "America/Los_Angeles",
-            "JST": "Asia/Tokyo",
-            "GMT": "UTC",
-        }
-
-        # Try alias first
-        if timezone.upper() in aliases:
-            return aliases[timezone.upper()]
-
-        # Try as is
-        if timezone in available_timezones():
-            return timezone
-
-        # Try common variations
-        variations = [
-            timezone,
-            timezone.upper(),
-            timezone.lower(),
-            timezone.title(),
-            f"Etc/{timezone}",
-        ]
-
-        for var in variations:
-            if var in available_timezones():
-                return var
-
-        raise ValueError(f"Invalid timezone: {timezone}")
+        return _normalize_timezone(timezone)
 
     def _execute_impl(
         self,
@@ -117,18 +170,19 @@ class CurrentTimeTool(BaseTool):
         """Execute the time tool.
 
         Args:
-            timezone: Timezone to get time in (defaults to local timezone)
+            timezone: Timezone to get time in (defaults to local timezone, which
+                can also be requested as "local")
             minutes_offset: Optional number of minutes to add to current time
 
         Returns:
             Current or future time in specified timezone
         """
         try:
-            # Use local timezone if none specified
+            # Use local timezone if none specified, without any timezone lookup
             tz = None
-            if timezone:
+            if timezone and timezone.lower() != "local":
                 normalized_tz = self._normalize_timezone(timezone)
-                tz = ZoneInfo(normalized_tz)
+                tz = _zoneinfo(normalized_tz)
 
             # Get current time in specified timezone
             current = datetime.now(tz)
@@ -138,7 +192,7 @@ class CurrentTimeTool(BaseTool):
                 current += timedelta(minutes=minutes_offset)
 
             # Format the time
-            return current.strftime("%Y-%m-%d %H:%M:%S %Z")
+            return current.strftime(_TIME_FORMAT)
 
         except Exception as e:
             raise ValueError(f"Error getting time: {str(e)}")
@@ -19,6 +19,28 @@ def validate_tool_schema(tool_name: str, schema: Dict[str, Any]) -> None:
         raise ValueError("Schema name must match tool name")
 
 
+def create_parameter_validator(schema: Dict[str, Any]) -> Any:
+    """Create a reusable validator for a tool's parameters.
+
+    The parameter schema is checked once here, so validating with the returned
+    validator skips the schema check and validator construction that
+    jsonschema.validate repeats on every call.
+
+    Args:
+        schema: Tool schema
+
+    Returns:
+        jsonschema validator for the tool's parameters
+
+    Raises:
+        jsonschema.exceptions.SchemaError: If the parameter schema is invalid
+    """
+    param_schema = schema["parameters"]
+    validator_class = jsonschema.validators.validator_for(param_schema)
+    validator_class.check_schema(param_schema)
+    return validator_class(param_schema)
+
+
 def validate_tool_parameters(schema: Dict[str, Any], **kwargs: Any) -> None:
     """Validate parameters against tool schema.
 
@@ -29,17 +51,27 @@ def validate_tool_parameters(schema: Dict[str, Any], **kwargs: Any) -> None:
     Raises:
         ValueError: If parameters are invalid
     """
-    param_schema = schema["parameters"]
+    check_tool_parameters(create_parameter_validator(schema), kwargs)
+
 
-    try:
-        jsonschema.validate(instance=kwargs, schema=param_schema)
-    except jsonschema.exceptions.ValidationError as e:
-        error_str = str(e)
+def check_tool_parameters(validator: Any, parameters: Dict[str, Any]) -> None:
+    """Validate parameters with a validator from create_parameter_validator.
+
+    Args:
+        validator: Validator for the tool's parameters
+        parameters: Parameters to validate
+
+    Raises:
+        ValueError: If parameters are invalid
+    """
+    error = jsonschema.exceptions.best_match(validator.iter_errors(parameters))
+    if error is not None:
+        error_str = str(error)
         if "required" in error_str:
-            raise ValueError("Missing required parameter") from e
+            raise ValueError("Missing required parameter") from error
         elif "minItems" in error_str:
-            raise ValueError("Array must have at least 1 item") from e
+            raise ValueError("Array must have at least 1 item") from error
         elif "type" in error_str:
-            raise ValueError("Invalid parameter type") from e
+            raise ValueError("Invalid parameter type") from error
         else:
-            raise ValueError(f"Invalid parameters: {error_str}") from e
+            raise ValueError(f"Invalid parameters: {error_str}") from error
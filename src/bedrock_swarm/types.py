@@ -25,14 +25,27 @@ class ToolOutput(TypedDict):
     output: str
 
 
-class MessageResponse(TypedDict):
+class TokenUsage(TypedDict):
+    """Token counts reported by Bedrock for a single invocation."""
+
+    input_tokens: int
+    output_tokens: int
+
+
+class _ResponseUsage(TypedDict, total=False):
+    """Optional token usage attached to model responses."""
+
+    usage: TokenUsage
+
+
+class MessageResponse(_ResponseUsage):
     """Structure of a message response."""
 
     type: Literal["message"]
     content: str
 
 
-class ToolCallResponse(TypedDict):
+class ToolCallResponse(_ResponseUsage):
     """Structure of a tool call response."""
 
     type: Literal["tool_call"]
@@ -1,12 +1,11 @@
 """Shared test fixtures for unit tests."""
 
-from typing import Any, Dict, Generator, List, Optional, cast
+from typing import Any, Dict, Generator
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from bedrock_swarm.config import AWSConfig
-from bedrock_swarm.models.base import BedrockModel
 from bedrock_swarm.tools.base import BaseTool
 
 
@@ -129,61 +128,6 @@ def mock_tool() -> MockTool:
     return MockTool()
 
 
-# Mock Model Fixtures
-class MockBedrockModel(BedrockModel):
-    """Mock model implementation for testing."""
-
-    def get_default_max_tokens(self) -> int:
-        """Get the default maximum tokens."""
-        return 4096
-
-    def supports_tools(self) -> bool:
-        """Check if the model supports tools."""
-        return True
-
-    def supports_streaming(self) -> bool:
-        """Check if the model supports streaming."""
-        return True
-
-    def process_message(
-        self,
-        client: Any,
-        message: str,
-        system: str,
-        tools: Optional[List[Dict[str, Any]]] = None,
-        temperature: float = 0.7,
-        max_tokens: Optional[int] = None,
-        tool_map: Optional[Dict[str, BaseTool]] = None,
-    ) -> str:
-        """Process a message."""
-        return "Mock response"
-
-    def format_request(
-        self,
-        message: str,
-        system: Optional[str] = None,
-        tools: Optional[List[Dict[str, Any]]] = None,
-        temperature: float = 0.7,
-        max_tokens: int = 4096,
-    ) -> Dict[str, Any]:
-        """Format a request."""
-        return {"mock": "request"}
-
-    def parse_response(self, response: Dict[str, Any]) -> str:
-        """Parse a response."""
-        return cast(str, response.get("response", ""))
-
-    def parse_stream_chunk(self, chunk: Dict[str, Any]) -> Optional[str]:
-        """Parse a stream chunk."""
-        return cast(str, chunk.get("chunk", ""))
-
-
-@pytest.fixture
-def mock_model() -> MockBedrockModel:
-    """Fixture providing a mock model instance."""
-    return MockBedrockModel()
-
-
 # Web Request Fixtures
 @pytest.fixture
 def mock_requests() -> Generator[MagicMock, None, None]:
@@ -1,7 +1,7 @@
 """Tests for agent implementation."""
 
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 
@@ -260,7 +260,9 @@ def test_aws_session_initialization(mock_aws_config) -> None:
         agent.generate("Test message")
         mock_session.return_value.client.assert_called_with(
             "bedrock-runtime",
+            region_name=None,
             endpoint_url="https://bedrock-runtime.us-west-2.amazonaws.com",
+            config=ANY,
         )
 
 
@@ -278,6 +280,40 @@ def test_last_token_count(agent: BedrockAgent) -> None:
     assert agent.last_token_count == 0
 
 
+def test_last_token_count_from_usage(
+    agent: BedrockAgent, mock_model: MagicMock
+) -> None:
+    """Test token usage reported with a response updates the token count."""
+    mock_model.invoke.return_value = {
+        "type": "message",
+        "content": "Test response",
+        "usage": {"input_tokens": 12, "output_tokens": 30},
+    }
+    agent.generate("Test message")
+    assert agent.last_token_count == 42
+
+
+def test_native_tools(agent: BedrockAgent, mock_model: MagicMock) -> None:
+    """Test native tool use sends schemas instead of describing tools."""
+    tool = MockTool()
+    agent.tools = {tool.name: tool}
+
+    agent.generate("Test message")
+    assert mock_model.invoke.call_args[1]["tools"] is None
+    assert "<tools>" in mock_model.invoke.call_args[1]["message"]
+
+    agent.native_tools = True
+    agent.generate("Test message")
+    assert mock_model.invoke.call_args[1]["tools"] == [tool.get_schema()]
+    assert "<tools>" not in mock_model.invoke.call_args[1]["message"]
+
+    # Models without native tool use keep the prompt description
+    mock_model.supports_tools.return_value = False
+    agent.generate("Test message")
+    assert mock_model.invoke.call_args[1]["tools"] is None
+    assert "<tools>" in mock_model.invoke.call_args[1]["message"]
+
+
 def test_model_initialization_error() -> None:
     """Test model initialization error handling."""
     with patch("bedrock_swarm.models.factory.ModelFactory.create_model") as mock_create:
@@ -293,18 +329,30 @@ def test_model_initialization_error() -> None:
 
 def test_generate_error_handling(agent: BedrockAgent, mock_model: MagicMock) -> None:
     """Test error handling in generate method."""
+    # Test client initialization error
+    with patch.object(agent.session, "client") as mock_client:
+        mock_client.side_effect = Exception("Client error")
+
+        with pytest.raises(Exception, match="Client error"):
+            agent.generate("Test message")
+
     # Test model invocation error
     mock_model.invoke.side_effect = Exception("Model error")
 
     with pytest.raises(Exception, match="Model error"):
         agent.generate("Test message")
 
-    # Test client initialization error
+
+def test_client_reused(agent: BedrockAgent) -> None:
+    """Test one pooled client is created and shared by later requests."""
     with patch.object(agent.session, "client") as mock_client:
-        mock_client.side_effect = Exception("Client error")
+        agent.generate("first")
+        agent.generate("second")
 
-        with pytest.raises(Exception, match="Client error"):
-            agent.generate("Test message")
+    mock_client.assert_called_once()
+    config = mock_client.call_args[1]["config"]
+    assert config.max_pool_connections == 50
+    assert config.tcp_keepalive is True
 
 
 def test_prompt_building_with_history(agent: BedrockAgent) -> None:
@@ -413,3 +461,90 @@ def test_memory_cleanup(agent: BedrockAgent) -> None:
     assert len(messages) == 1000
     assert messages[0].metadata["index"] == 100  # First 100 should be removed
     assert messages[-1].metadata["index"] == 1099  # Last message should be present
+
+
+def test_generate_batch(agent: BedrockAgent, mock_model: MagicMock) -> None:
+    """Test batched generation with a shared client."""
+    mock_model.invoke.side_effect = lambda client, message, **kwargs: {
+        "type": "message",
+        "content": f"Reply to {message.rsplit('<input>', 1)[1]}",
+    }
+
+    with patch.object(agent.session, "client") as mock_client, patch.object(
+        agent.memory, "add_messages", wraps=agent.memory.add_messages
+    ) as mock_add:
+        responses = agent.generate_batch(["first", "second", "third"])
+
+    # One client is created for the whole batch
+    mock_client.assert_called_once()
+    assert mock_model.invoke.call_count == 3
+
+    # Messages and responses are each written to memory in one batch
+    assert mock_add.call_count == 2
+
+    # Responses keep input order
+    assert [r["content"] for r in responses] == [
+        "Reply to first</input>",
+        "Reply to second</input>",
+        "Reply to third</input>",
+    ]
+
+    # Messages and responses are recorded in memory
+    messages = agent.memory.get_messages()
+    assert [m.content for m in messages if m.role == "user"] == [
+        "first",
+        "second",
+        "third",
+    ]
+    assert len([m for m in messages if m.role == "assistant"]) == 3
+
+    # Empty batches are a no-op
+    assert agent.generate_batch([]) == []
+
+
+def test_build_prompt_caches_tool_schemas(agent: BedrockAgent) -> None:
+    """Test tool schemas are serialized once until the tools change."""
+    tool = MockTool()
+    agent.tools = {tool.name: tool}
+
+    with patch.object(tool, "get_schema", wraps=tool.get_schema) as mock_schema:
+        first = agent._build_prompt("First message")
+        second = agent._build_prompt("Second message")
+        assert mock_schema.call_count == 1
+        assert "Schema:" in first and "Schema:" in second
+
+        # Adding a tool invalidates the cache, but existing tools keep their
+        # schema
+        other = MockTool()
+        other._name = "other_tool"
+        agent.tools[other.name] = other
+        prompt = agent._build_prompt("Third message")
+        assert "other_tool" in prompt
+        assert mock_schema.call_count == 1
+
+
+def test_build_prompt_stable_prefix(agent: BedrockAgent) -> None:
+    """Test the static prompt prefix is identical across requests."""
+    agent.system_prompt = "Test system prompt"
+    first = agent._build_prompt("First message")
+
+    agent.memory.add_message(
+        Message(role="user", content="History message", timestamp=datetime.now())
+    )
+    second = agent._build_prompt("Second message")
+
+    prefix = agent._get_prompt_prefix()
+    assert first.startswith(prefix)
+    assert second.startswith(prefix)
+    assert second.index("<response_format>") < second.index("History message")
+
+    # Changing the configuration rebuilds the prefix
+    agent.role = "New role"
+    assert "expertise in: New role" in agent._build_prompt("Third message")
+
+
+def test_agent_slots(agent: BedrockAgent) -> None:
+    """Test agents store their attributes in slots."""
+    assert not hasattr(agent, "__dict__")
+    with pytest.raises(AttributeError):
+        agent.undeclared_attribute = "value"
@@ -2,7 +2,7 @@
 
 import pytest
 
-from bedrock_swarm.tools.calculator import CalculatorTool
+from bedrock_swarm.tools.calculator import CalculatorTool, _parse_expression
 
 
 @pytest.fixture
@@ -80,6 +80,10 @@ def test_complex_expressions():
     assert calc._execute_impl(expression="1.5 + 2.5") == "4.0"
     assert calc._execute_impl(expression="3.0 * 2") == "6.0"
 
+    # Floor division and powers
+    assert calc._execute_impl(expression="7 // 2") == "3"
+    assert calc._execute_impl(expression="2 ** 3") == "8"
+
 
 def test_invalid_expressions():
     """Test handling of invalid expressions."""
@@ -103,6 +107,10 @@ def test_invalid_expressions():
     with pytest.raises(ValueError, match="Invalid expression"):
         calc._execute_impl(expression="1/0")
 
+    # Allowed characters forming something other than arithmetic
+    with pytest.raises(ValueError, match="Invalid expression"):
+        calc._execute_impl(expression="...")
+
 
 def test_whitespace_handling():
     """Test handling of whitespace in expressions."""
@@ -119,3 +127,16 @@ def test_whitespace_handling():
         calc._execute_impl(expression="2 +\t2")
     with pytest.raises(ValueError, match="Invalid characters in expression"):
         calc._execute_impl(expression="2 +\n2")
+
+
+def test_parsed_expression_cached():
+    """Test repeated expressions are only parsed once."""
+    calc = CalculatorTool()
+    _parse_expression.cache_clear()
+
+    assert calc._execute_impl(expression="6 * 7") == "42"
+    assert calc._execute_impl(expression="6 * 7") == "42"
+
+    info = _parse_expression.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
@@ -178,6 +178,14 @@ def test_event_filtering(event_system: EventSystem) -> None:
     assert combined[0]["agent_name"] == "agent1"
     assert combined[0]["type"] == "agent_start"
 
+    # Unknown values match nothing, no filters match everything
+    assert event_system.get_events(run_id="missing") == []
+    assert event_system.get_events(run_id="run1", agent_name="missing") == []
+    assert len(event_system.get_events()) == 3
+
+    # Unknown event IDs yield an empty chain
+    assert event_system.get_event_chain("missing") == []
+
 
 def test_event_chain(event_system: EventSystem) -> None:
     """Test event chain retrieval."""
@@ -253,3 +261,38 @@ def test_event_formatting(event_system: EventSystem) -> None:
     # Format event chain
     chain_str = event_system.format_event_chain(event_id)
     assert formatted in chain_str  # Chain includes the event
+
+
+def test_event_formatting_timestamps(event_system: EventSystem) -> None:
+    """Test timestamps are formatted to millisecond precision."""
+    event = create_test_event()
+
+    event["timestamp"] = "2024-02-21T14:30:05.123456"
+    assert event_system.format_event(event).startswith("[14:30:05.123]")
+
+    # Timestamps without microseconds or with offsets are parsed
+    event["timestamp"] = "2024-02-21T14:30:05"
+    assert event_system.format_event(event).startswith("[14:30:05.000]")
+    event["timestamp"] = "2024-02-21T14:30:05.123456+00:00"
+    assert event_system.format_event(event).startswith("[14:30:05.123]")
+
+
+def test_event_formatting_cache(event_system: EventSystem) -> None:
+    """Test formatted output is cached for recorded events only."""
+    event_id = event_system.create_event(
+        type="agent_start",
+        agent_name="test_agent",
+        run_id="test_run",
+        thread_id="test_thread",
+        details={"message": "Cached"},
+    )
+    event = event_system.events[0]
+    formatted = event_system.format_event(event)
+    assert event_system._formatted[event_id] == formatted
+    assert event_system.format_event(event) is formatted
+
+    # External events with a colliding ID are formatted fresh
+    external = create_test_event(details={"message": "External"})
+    external["id"] = event_id
+    assert "External" in event_system.format_event(external)
+    assert event_system._formatted[event_id] == formatted
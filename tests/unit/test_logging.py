@@ -0,0 +1,132 @@
+"""Tests for logging configuration."""
+
+import io
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from bedrock_swarm import logging as swarm_logging
+from bedrock_swarm.logging import configure_logging, set_log_level
+
+
+@pytest.fixture(autouse=True)
+def restore_logger() -> Iterator[logging.Logger]:
+    """Give each test its own listener and restore the logger afterwards."""
+    logger = logging.getLogger("bedrock_swarm")
+    handlers = logger.handlers[:]
+    level = logger.level
+    propagate = logger.propagate
+    original = swarm_logging._listener
+    swarm_logging._stop_listener()
+    swarm_logging._listener = None
+    yield logger
+    swarm_logging._stop_listener()
+    swarm_logging._listener = original
+    if original is not None:
+        original.start()
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+    logger.propagate = propagate
+
+
+def test_configure_logging_is_idempotent(restore_logger: logging.Logger) -> None:
+    """Test repeated calls do not attach duplicate handlers."""
+    stream = io.StringIO()
+
+    configure_logging(level="INFO", handlers=[logging.StreamHandler(stream)])
+    configure_logging(
+        level="INFO",
+        format_string="%(message)s",
+        handlers=[logging.StreamHandler(stream)],
+    )
+
+    assert restore_logger.handlers.count(swarm_logging._queue_handler) == 1
+    assert swarm_logging._listener is not None
+    assert len(swarm_logging._listener.handlers) == 1
+    assert restore_logger.propagate is False
+
+    logging.getLogger("bedrock_swarm.test").info("hello")
+    swarm_logging._stop_listener()
+    # The latest format applies and the record is written exactly once
+    assert stream.getvalue() == "hello\n"
+
+
+def test_records_are_written_off_the_calling_thread() -> None:
+    """Test handlers run on the listener thread rather than the caller's."""
+    emitted_on = []
+
+    class RecordingHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            emitted_on.append(threading.current_thread())
+
+    configure_logging(level="INFO", handlers=[RecordingHandler()])
+    logging.getLogger("bedrock_swarm.test").info("hello")
+    swarm_logging._stop_listener()
+
+    assert len(emitted_on) == 1
+    assert emitted_on[0] is not threading.current_thread()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_writes_records(tmp_path: Path) -> None:
+    """Test a forked child gets a running listener and its records are written."""
+    log_file = tmp_path / "child.log"
+    handler = logging.FileHandler(log_file)
+    configure_logging(level="INFO", format_string="%(message)s", handlers=[handler])
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - runs in the child
+        code = 1
+        try:
+            logging.getLogger("bedrock_swarm.test").info("from child")
+            # What atexit does on a normal interpreter exit
+            swarm_logging._stop_listener()
+            code = 0
+        finally:
+            os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+    swarm_logging._stop_listener()
+    handler.close()
+
+    assert os.WEXITSTATUS(status) == 0
+    assert log_file.read_text() == "from child\n"
+
+
+def test_set_log_level() -> None:
+    """Test level names are case-insensitive and validated."""
+    set_log_level("debug", "bedrock_swarm.test")
+    assert logging.getLogger("bedrock_swarm.test").level == logging.DEBUG
+
+    with pytest.raises(ValueError, match="Invalid log level"):
+        set_log_level("VERBOSE", "bedrock_swarm.test")
+    set_log_level("NOTSET", "bedrock_swarm.test")
+
+
+def test_listener_flushes_once_per_batch() -> None:
+    """Test a burst of records is written with one flush, not one per record."""
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stream = io.StringIO()
+    flushes = []
+
+    class CountingHandler(swarm_logging._DeferredFlushStreamHandler):
+        def flush(self) -> None:
+            flushes.append(1)
+            super().flush()
+
+    handler = CountingHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    for i in range(5):
+        records.put(logging.makeLogRecord({"msg": f"record {i}"}))
+
+    listener = swarm_logging._BatchingQueueListener(records, handler)
+    listener.start()
+    listener.stop()
+
+    assert stream.getvalue() == "".join(f"record {i}\n" for i in range(5))
+    assert 1 <= len(flushes) <= 2
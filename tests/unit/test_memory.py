@@ -1,7 +1,14 @@
 """Tests for the memory module."""
 
+import copy
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from datetime import datetime, timedelta
 
+import pytest
+
 from bedrock_swarm.memory.base import Message, SimpleMemory
 
 
@@ -42,6 +49,23 @@ def test_add_message() -> None:
     assert messages[0] == message
 
 
+def test_add_messages() -> None:
+    """Test adding several messages at once."""
+    memory = SimpleMemory()
+    now = datetime.now()
+    batch = [
+        Message(role="human", content="Question", timestamp=now, thread_id="t1"),
+        Message(role="assistant", content="Answer", timestamp=now, thread_id="t1"),
+    ]
+    memory.add_messages(batch)
+
+    assert memory.get_messages("t1") == batch
+    assert memory.get_last_message("t1") == batch[1]
+
+    memory.add_messages([])
+    assert len(memory.get_messages()) == 2
+
+
 def test_max_size_limit() -> None:
     """Test max size limit enforcement."""
     memory = SimpleMemory(max_size=2)
@@ -60,6 +84,26 @@ def test_max_size_limit() -> None:
     assert stored_messages == messages[-2:]
 
 
+def test_zero_max_size() -> None:
+    """Test a max_size of zero keeps no messages and keeps indexes empty."""
+    memory = SimpleMemory(max_size=0)
+    now = datetime.now()
+    for i in range(3):
+        memory.add_message(
+            Message(
+                role="user",
+                content=f"Message {i}",
+                timestamp=now + timedelta(seconds=i),
+                metadata={"type": "user_message"},
+            )
+        )
+
+    assert memory.get_messages() == []
+    assert memory.get_messages("default") == []
+    assert memory.get_messages_by_type("user_message") == []
+    assert memory.get_last_message() is None
+
+
 def test_get_messages_filtering() -> None:
     """Test message filtering options."""
     memory = SimpleMemory()
@@ -166,6 +210,10 @@ def test_get_messages_by_role() -> None:
     assert any(m.role == "user" for m in all_messages)
     assert any(m.role == "assistant" for m in all_messages)
 
+    assert memory.get_messages_by_role("user") == [user_message]
+    assert memory.get_messages_by_role("assistant", "default") == [assistant_message]
+    assert memory.get_messages_by_role("system") == []
+
 
 def test_get_messages_by_type() -> None:
     """Test getting messages by type."""
@@ -305,6 +353,19 @@ def test_get_conversation_summary() -> None:
     assert summary[-2]["assistant"] == "Tool call"
     assert summary[-2]["has_tool_calls"] is True
 
+    # Full summary keeps chronological order
+    summary = memory.get_conversation_summary(limit=10)
+    assert [pair["user"] for pair in summary] == [
+        "Question 1",
+        "Question 2",
+        "Question 3",
+    ]
+    assert summary[0]["assistant"] == "Answer 1"
+
+    # Non-positive limits yield an empty summary
+    assert memory.get_conversation_summary(limit=0) == []
+    assert memory.get_conversation_summary(limit=-1) == []
+
 
 def test_thread_management() -> None:
     """Test thread-specific memory management."""
@@ -367,3 +428,225 @@ def test_memory_metadata() -> None:
     assert retrieved.metadata["type"] == "tool_call_intent"
     assert retrieved.metadata["tool_calls"][0]["id"] == "123"
     assert retrieved.metadata["agent"] == "test_agent"
+
+
+def test_global_order_with_eviction_and_clear_thread() -> None:
+    """Test cross-thread ordering survives eviction and thread removal."""
+    memory = SimpleMemory(max_size=2)
+    base = datetime.now()
+    messages = [
+        Message(
+            role="user",
+            content=f"Message {i}",
+            timestamp=base + timedelta(seconds=offset),
+            thread_id=thread_id,
+        )
+        for i, (offset, thread_id) in enumerate(
+            [(0, "a"), (3, "b"), (1, "a"), (2, "a"), (4, "b")]
+        )
+    ]
+    for message in messages:
+        memory.add_message(message)
+
+    # Thread "a" evicted its oldest message; out-of-order arrivals are merged
+    assert memory.get_messages() == [messages[2], messages[3], messages[1], messages[4]]
+
+    memory.clear_thread("a")
+    assert memory.get_messages() == [messages[1], messages[4]]
+
+
+def test_shared_state_has_no_instance_dict() -> None:
+    """Test SharedState declares slots instead of a per-instance __dict__."""
+    memory = SimpleMemory()
+    assert not hasattr(memory.shared_state, "__dict__")
+    memory.shared_state.set("key", "value")
+    assert memory.shared_state.get("key") == "value"
+
+
+def test_type_index_tracks_eviction() -> None:
+    """Test per-thread type lookups drop messages evicted from the thread."""
+    memory = SimpleMemory(max_size=2)
+    results = [
+        Message(
+            role="system",
+            content=f"Tool result {i}",
+            timestamp=datetime.now(),
+            thread_id="thread1",
+            metadata={"type": "tool_result"},
+        )
+        for i in range(3)
+    ]
+    for message in results:
+        memory.add_message(message)
+
+    assert memory.get_tool_results("thread1") == results[1:]
+    assert memory.get_messages_by_type("tool_result", "thread2") == []
+
+    memory.clear_thread("thread1")
+    assert memory.get_tool_results("thread1") == []
+
+
+def test_get_messages_returns_copy() -> None:
+    """Test callers cannot mutate stored messages through get_messages."""
+    for thread_id in ("thread1", None):
+        memory = SimpleMemory()
+        message = Message(
+            role="user",
+            content="Hello",
+            timestamp=datetime.now(),
+            thread_id=thread_id,
+            metadata={"type": "tool_result"},
+        )
+        memory.add_message(message)
+
+        memory.get_messages(thread_id).clear()
+        assert memory.get_messages(thread_id) == [message]
+        assert memory.get_last_message(thread_id) is message
+        assert memory.get_tool_results(thread_id, limit=1) == [message]
+
+
+def test_get_messages_between() -> None:
+    """Test timestamp range queries across and within threads."""
+    memory = SimpleMemory()
+    base = datetime.now()
+    messages = [
+        Message(
+            role="user",
+            content=f"Message {i}",
+            timestamp=base + timedelta(seconds=i),
+            thread_id="thread1" if i % 2 else "thread2",
+        )
+        for i in range(5)
+    ]
+    for message in messages:
+        memory.add_message(message)
+
+    start = base + timedelta(seconds=1)
+    end = base + timedelta(seconds=4)
+    assert memory.get_messages_between(start, end) == messages[1:4]
+    assert memory.get_messages_between(start, end, "thread1") == [
+        messages[1],
+        messages[3],
+    ]
+    assert memory.get_messages_between(end=start) == messages[:1]
+    assert memory.get_messages_between() == messages
+
+
+def test_get_recent_messages() -> None:
+    """Test reading only the tail of the history."""
+    memory = SimpleMemory(max_size=3)
+    base = datetime.now()
+    messages = [
+        Message(
+            role="user",
+            content=f"Message {i}",
+            timestamp=base + timedelta(seconds=i),
+            thread_id="thread1",
+        )
+        for i in range(5)
+    ]
+    for message in messages:
+        memory.add_message(message)
+
+    assert memory.get_recent_messages(2) == messages[3:]
+    assert memory.get_recent_messages(2, "thread1") == messages[3:]
+    assert memory.get_recent_messages(10, "thread1") == messages[2:]
+    assert memory.get_recent_messages(0) == []
+
+
+def test_shared_state_get_or_set_runs_factory_once() -> None:
+    """Test concurrent get_or_set calls compute a missing value once."""
+    state = SimpleMemory().shared_state
+    calls = []
+
+    def factory() -> int:
+        calls.append(1)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda _: state.get_or_set("answer", factory), range(32))
+        )
+
+    assert results == [42] * 32
+    assert len(calls) == 1
+
+    state.clear()
+    assert state.get("answer") is None
+
+
+def test_shared_state_get_or_set_factory_uses_other_keys() -> None:
+    """Test a factory can read and write other keys without deadlocking."""
+    state = SimpleMemory().shared_state
+
+    def factory() -> int:
+        # With 16 stripes, some of these keys share the outer key's stripe
+        for i in range(64):
+            state.set(f"other_{i}", i)
+        return state.get_or_set("inner", lambda: 1) + state.get("other_63")
+
+    # Run in a daemon thread so a deadlock fails the test instead of hanging it
+    worker = threading.Thread(
+        target=state.get_or_set, args=("outer", factory), daemon=True
+    )
+    worker.start()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    assert state.get("outer") == 64
+    assert state.get("inner") == 1
+
+
+def test_shared_state_get_or_set_factory_raises() -> None:
+    """Test a failing factory stores nothing and can be retried."""
+    state = SimpleMemory().shared_state
+
+    def factory() -> int:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        state.get_or_set("answer", factory)
+
+    assert state.get("answer") is None
+    assert not state._pending
+    assert state.get_or_set("answer", lambda: 42) == 42
+    assert not state._pending
+
+
+def test_message_serialization() -> None:
+    """Test messages with metadata can be pickled, copied and converted."""
+    message = Message(
+        role="assistant",
+        content="Calling tool",
+        timestamp=datetime.now(),
+        metadata={"type": "tool_call_intent", "tool_calls": [{"id": "1"}]},
+    )
+
+    assert pickle.loads(pickle.dumps(message)) == message
+    copied = copy.deepcopy(message)
+    assert copied == message
+    assert copied.metadata is not message.metadata
+    assert asdict(message)["metadata"] == message.metadata
+
+
+def test_eviction_after_metadata_change() -> None:
+    """Test changing a stored message's metadata does not corrupt eviction."""
+    memory = SimpleMemory(max_size=1)
+    now = datetime.now()
+    first = Message(
+        role="user", content="First", timestamp=now, metadata={"type": "user_message"}
+    )
+    memory.add_message(first)
+    assert first.metadata is not None
+    first.metadata["type"] = "changed"
+
+    second = Message(
+        role="user",
+        content="Second",
+        timestamp=now + timedelta(seconds=1),
+        metadata={"type": "user_message"},
+    )
+    memory.add_message(second)
+
+    assert memory.get_messages() == [second]
+    assert memory.get_messages_by_type("user_message") == [second]
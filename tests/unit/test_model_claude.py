@@ -1,12 +1,18 @@
 """Tests for Claude model implementation."""
 
+import asyncio
 import json
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from botocore.exceptions import (
+    ClientError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
 
 from bedrock_swarm.exceptions import ModelInvokeError, ResponseParsingError
-from bedrock_swarm.models.claude import ClaudeModel
+from bedrock_swarm.models.claude import ClaudeModel, _scan_delta_text
 
 
 @pytest.fixture
@@ -226,6 +232,17 @@ def test_invoke(model: ClaudeModel, mock_client: MagicMock) -> None:
         model.invoke(client=mock_client, message="Test message")
 
 
+def test_invoke_error_not_rewrapped(model: ClaudeModel, mock_client: MagicMock) -> None:
+    """Test errors from the retry loop are raised without a nested prefix."""
+    mock_client.invoke_model_with_response_stream.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "Denied"}},
+        "invoke_model_with_response_stream",
+    )
+    with pytest.raises(ModelInvokeError) as exc_info:
+        model.invoke(client=mock_client, message="Test message")
+    assert str(exc_info.value).count("Error invoking model") == 1
+
+
 def test_token_validation(model: ClaudeModel) -> None:
     """Test token count validation."""
     # Test default tokens
@@ -243,3 +260,539 @@ def test_token_validation(model: ClaudeModel) -> None:
     assert model.validate_token_count(None) == 500
     with pytest.raises(ValueError, match="exceeds model's limit"):
         model.validate_token_count(1500)
+
+
+def test_stream(model: ClaudeModel, mock_client: MagicMock) -> None:
+    """Test streaming content as it arrives."""
+    mock_stream = MagicMock()
+    mock_stream.__iter__.return_value = [
+        {
+            "chunk": {
+                "bytes": json.dumps(
+                    {"type": "content_block_delta", "delta": {"text": text}}
+                ).encode()
+            }
+        }
+        for text in ("Hello", " world")
+    ] + [{"chunk": {"bytes": json.dumps({"type": "message_stop"}).encode()}}]
+    mock_client.invoke_model_with_response_stream.return_value = {"body": mock_stream}
+
+    chunks = model.stream(client=mock_client, message="Test message")
+    assert next(chunks) == "Hello"
+    assert list(chunks) == [" world"]
+
+    # Invocation errors surface when the stream is consumed
+    mock_client.invoke_model_with_response_stream.side_effect = Exception("API error")
+    with pytest.raises(ModelInvokeError, match="Error invoking model"):
+        list(model.stream(client=mock_client, message="Test message"))
+
+
+def test_serialize_request(model: ClaudeModel) -> None:
+    """Test request serialization matches the request dictionary."""
+    request = model.format_request(
+        message='Say "hi"\n', system="Système", temperature=0.25, max_tokens=100
+    )
+    assert json.loads(model._serialize_request(request)) == request
+
+    # Requests with extra fields use full serialization
+    request["top_p"] = 0.9
+    assert json.loads(model._serialize_request(request)) == request
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        ('{"type": "message", "content": "Hi"}', {"type": "message", "content": "Hi"}),
+        ('{"type": "message"}', {"type": "message", "content": ""}),
+        (
+            '{"type": "tool_call", "tool_calls": []}',
+            {"type": "message", "content": '{"type": "tool_call", "tool_calls": []}'},
+        ),
+        ('{"type": "other"}', {"type": "message", "content": '{"type": "other"}'}),
+        ("{not json}", {"type": "message", "content": "{not json}"}),
+        (
+            '{"type": ["x"], "inner": {"type": "message"}}',
+            {
+                "type": "message",
+                "content": '{"type": ["x"], "inner": {"type": "message"}}',
+            },
+        ),
+        (
+            '{"type": {"type": "message"}}',
+            {"type": "message", "content": '{"type": {"type": "message"}}'},
+        ),
+        (
+            'Sure:\n{"type": "message", "content": "a } in {text"}\nDone',
+            {"type": "message", "content": "a } in {text"},
+        ),
+        (
+            '\n{"type": "tool_call", "tool_calls": [{"id": "call_1"}]}',
+            {"type": "tool_call", "tool_calls": [{"id": "call_1"}]},
+        ),
+        ("Use {braces} freely", {"type": "message", "content": "Use {braces} freely"}),
+        (
+            'Given {x}, reply:\n{"type": "message", "content": "y"}',
+            {"type": "message", "content": "y"},
+        ),
+    ],
+)
+def test_process_response_types(model: ClaudeModel, content: str, expected) -> None:
+    """Test JSON responses are dispatched on their type field."""
+    with patch.object(model, "_extract_content", return_value=content):
+        assert model.process_response({"body": []}) == expected
+
+
+def test_ainvoke(model: ClaudeModel, mock_client: MagicMock) -> None:
+    """Test concurrent asynchronous invocation."""
+    mock_client.invoke_model_with_response_stream.side_effect = lambda **_: {
+        "body": [
+            {
+                "chunk": {
+                    "bytes": json.dumps(
+                        {"type": "content_block_delta", "delta": {"text": "Hi"}}
+                    ).encode()
+                }
+            }
+        ]
+    }
+
+    async def run() -> list:
+        return await asyncio.gather(
+            model.ainvoke(client=mock_client, message="First"),
+            model.ainvoke(client=mock_client, message="Second"),
+        )
+
+    responses = asyncio.run(run())
+    assert responses == [{"type": "message", "content": "Hi"}] * 2
+    assert mock_client.invoke_model_with_response_stream.call_count == 2
+
+
+def test_ainvoke_retry_does_not_block(
+    model: ClaudeModel, mock_client: MagicMock
+) -> None:
+    """Test async throttling backoff awaits asyncio.sleep instead of blocking."""
+    throttled = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "invoke_model_with_response_stream",
+    )
+    mock_client.invoke_model_with_response_stream.side_effect = [
+        throttled,
+        {"body": []},
+    ]
+
+    with patch("time.sleep") as mock_sleep, patch(
+        "asyncio.sleep", new_callable=AsyncMock
+    ) as mock_async_sleep:
+        response = asyncio.run(model.ainvoke(client=mock_client, message="Hi"))
+
+    assert response == {"type": "message", "content": ""}
+    mock_sleep.assert_not_called()
+    mock_async_sleep.assert_awaited_once()
+    assert mock_client.invoke_model_with_response_stream.call_count == 2
+
+
+def test_latency_optimized_request(mock_client: MagicMock) -> None:
+    """Test latency-optimized inference is requested and falls back if rejected."""
+    model = ClaudeModel(
+        "us.anthropic.claude-3-5-sonnet-20241022-v2:0", latency="optimized"
+    )
+    request = model.format_request(message="Test message")
+    rejected = ClientError(
+        {"Error": {"Code": "ValidationException", "Message": "Unsupported"}},
+        "invoke_model_with_response_stream",
+    )
+    mock_client.invoke_model_with_response_stream.side_effect = [rejected, {"body": []}]
+
+    assert model._invoke_with_retry(mock_client, request) == {"body": []}
+
+    first, second = mock_client.invoke_model_with_response_stream.call_args_list
+    assert first[1]["performanceConfigLatency"] == "optimized"
+    assert "performanceConfigLatency" not in second[1]
+
+    with pytest.raises(ValueError, match="Invalid latency"):
+        model.set_config({"latency": "fast"})
+
+
+def test_retry_backoff(model: ClaudeModel, mock_client: MagicMock) -> None:
+    """Test throttled retries use jittered delays and honor Retry-After."""
+    throttled = ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+        "invoke_model_with_response_stream",
+    )
+    hinted = ClientError(
+        {
+            "Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"},
+            "ResponseMetadata": {"HTTPHeaders": {"retry-after": "2"}},
+        },
+        "invoke_model_with_response_stream",
+    )
+    mock_client.invoke_model_with_response_stream.side_effect = [
+        throttled,
+        hinted,
+        {"body": []},
+    ]
+
+    with patch("time.sleep") as mock_sleep, patch.object(
+        model, "_serialize_request", return_value=b"{}"
+    ) as serialize:
+        model._invoke_with_retry(mock_client, {}, initial_delay=0.1)
+
+    first, second = (call[0][0] for call in mock_sleep.call_args_list)
+    assert 0.1 <= first <= 0.3
+    assert second == 2.0
+    # The body is serialized once and resent on every attempt
+    serialize.assert_called_once_with({})
+    bodies = [
+        call.kwargs["body"]
+        for call in mock_client.invoke_model_with_response_stream.call_args_list
+    ]
+    assert bodies == [b"{}"] * 3
+
+
+@pytest.mark.parametrize("header, expected", [("3600", 20.0), ("-5", 0.0)])
+def test_retry_after_is_bounded(
+    model: ClaudeModel, mock_client: MagicMock, header: str, expected: float
+) -> None:
+    """Test Retry-After hints are clamped to [0, max_delay]."""
+    hinted = ClientError(
+        {
+            "Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"},
+            "ResponseMetadata": {"HTTPHeaders": {"retry-after": header}},
+        },
+        "invoke_model_with_response_stream",
+    )
+    mock_client.invoke_model_with_response_stream.side_effect = [hinted, {"body": []}]
+
+    with patch("time.sleep") as mock_sleep:
+        model._invoke_with_retry(mock_client, {}, max_delay=20.0)
+
+    if expected:
+        mock_sleep.assert_called_once_with(expected)
+    else:
+        mock_sleep.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ClientError(
+            {"Error": {"Code": code, "Message": "Try again"}},
+            "invoke_model_with_response_stream",
+        )
+        for code in [
+            "ServiceUnavailableException",
+            "InternalServerException",
+            "ModelNotReadyException",
+        ]
+    ]
+    + [
+        EndpointConnectionError(endpoint_url="https://bedrock-runtime"),
+        ReadTimeoutError(endpoint_url="https://bedrock-runtime"),
+    ],
+)
+def test_retry_transient_errors(
+    model: ClaudeModel, mock_client: MagicMock, error: Exception
+) -> None:
+    """Test transient service and connection errors are retried with backoff."""
+    mock_client.invoke_model_with_response_stream.side_effect = [error, {"body": []}]
+
+    with patch("time.sleep") as mock_sleep:
+        assert model._invoke_with_retry(mock_client, {}) == {"body": []}
+
+    assert mock_client.invoke_model_with_response_stream.call_count == 2
+    mock_sleep.assert_called_once()
+
+    # Still transient on the last attempt: the error is reported
+    mock_client.invoke_model_with_response_stream.reset_mock()
+    mock_client.invoke_model_with_response_stream.side_effect = error
+    with patch("time.sleep"), pytest.raises(ModelInvokeError):
+        model._invoke_with_retry(mock_client, {}, max_retries=3)
+    assert mock_client.invoke_model_with_response_stream.call_count == 3
+
+
+def test_ainvoke_retries_connection_errors(
+    model: ClaudeModel, mock_client: MagicMock
+) -> None:
+    """Test the async path retries connection errors too."""
+    mock_client.invoke_model_with_response_stream.side_effect = [
+        EndpointConnectionError(endpoint_url="https://bedrock-runtime"),
+        {"body": []},
+    ]
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_async_sleep:
+        response = asyncio.run(model.ainvoke(client=mock_client, message="Hi"))
+
+    assert response == {"type": "message", "content": ""}
+    mock_async_sleep.assert_awaited_once()
+
+
+def test_non_retryable_error_not_retried(
+    model: ClaudeModel, mock_client: MagicMock
+) -> None:
+    """Test errors outside the transient set fail on the first attempt."""
+    mock_client.invoke_model_with_response_stream.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "Denied"}},
+        "invoke_model_with_response_stream",
+    )
+
+    with patch("time.sleep") as mock_sleep, pytest.raises(ModelInvokeError):
+        model._invoke_with_retry(mock_client, {})
+
+    assert mock_client.invoke_model_with_response_stream.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_process_response_usage(model: ClaudeModel) -> None:
+    """Test token usage from the stream's invocation metrics is returned."""
+    chunks = [
+        {"type": "content_block_delta", "delta": {"text": "Hi"}},
+        {
+            "type": "message_stop",
+            "amazon-bedrock-invocationMetrics": {
+                "inputTokenCount": 12,
+                "outputTokenCount": 3,
+            },
+        },
+    ]
+    response = {"body": [{"chunk": {"bytes": json.dumps(c).encode()}} for c in chunks]}
+
+    assert model.process_response(response) == {
+        "type": "message",
+        "content": "Hi",
+        "usage": {"input_tokens": 12, "output_tokens": 3},
+    }
+
+
+def test_extract_content_skips_non_delta_events(model: ClaudeModel) -> None:
+    """Test non-delta stream events are skipped without being parsed."""
+    chunks = [
+        {"type": "message_start", "message": {"content": []}},
+        {"type": "content_block_start", "index": 0},
+        {"type": "ping"},
+        {"type": "content_block_delta", "delta": {"text": "Hi"}},
+        {"type": "content_block_stop", "index": 0},
+        {"type": "message_delta", "delta": {"stop_reason": "end_turn"}},
+    ]
+    response = {"body": [{"chunk": {"bytes": json.dumps(c).encode()}} for c in chunks]}
+
+    with patch(
+        "bedrock_swarm.models.claude.serialization.loads", side_effect=json.loads
+    ) as loads:
+        assert model._extract_content(response) == "Hi"
+    assert loads.call_count == 1
+
+
+def test_format_request_tools(model: ClaudeModel) -> None:
+    """Test tool schemas are sent as native Claude tool definitions."""
+    schema = {
+        "name": "calculator",
+        "description": "Evaluate arithmetic",
+        "parameters": {"type": "object", "properties": {}},
+    }
+    request = model.format_request("Hi", tools=[schema])
+    assert request["tools"] == [
+        {
+            "name": "calculator",
+            "description": "Evaluate arithmetic",
+            "input_schema": {"type": "object", "properties": {}},
+        }
+    ]
+    assert json.loads(model._serialize_request(request)) == request
+
+
+def test_process_response_tool_use(model: ClaudeModel) -> None:
+    """Test streamed tool use blocks become a tool call response."""
+    chunks = [
+        {"type": "content_block_start", "index": 0, "content_block": {"type": "text"}},
+        {"type": "content_block_delta", "index": 0, "delta": {"text": "Let me check"}},
+        {
+            "type": "content_block_start",
+            "index": 1,
+            "content_block": {
+                "type": "tool_use",
+                "id": "toolu_1",
+                "name": "calculator",
+                "input": {},
+            },
+        },
+        {
+            "type": "content_block_delta",
+            "index": 1,
+            "delta": {"type": "input_json_delta", "partial_json": '{"expression"'},
+        },
+        {
+            "type": "content_block_delta",
+            "index": 1,
+            "delta": {"type": "input_json_delta", "partial_json": ': "2 + 2"}'},
+        },
+        {"type": "content_block_stop", "index": 1},
+    ]
+    response = {"body": [{"chunk": {"bytes": json.dumps(c).encode()}} for c in chunks]}
+
+    assert model.process_response(response) == {
+        "type": "tool_call",
+        "tool_calls": [
+            {
+                "id": "toolu_1",
+                "type": "function",
+                "function": {
+                    "name": "calculator",
+                    "arguments": {"expression": "2 + 2"},
+                },
+            }
+        ],
+    }
+
+
+def test_process_response_skips_scan_without_response_type(model: ClaudeModel) -> None:
+    """Test text without a response type field is never scanned for JSON."""
+    content = 'Use {"a": 1} or {"b": {"c": 2}} in the config'
+    with patch.object(model, "_extract_content", return_value=content), patch(
+        "bedrock_swarm.models.base._iter_json_objects"
+    ) as scan:
+        assert model.process_response({"body": []}) == {
+            "type": "message",
+            "content": content,
+        }
+    scan.assert_not_called()
+
+
+def test_converse_api(mock_client: MagicMock) -> None:
+    """Test invocation through the Converse API."""
+    model = ClaudeModel(
+        "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+        latency="optimized",
+        api="converse",
+    )
+    mock_client.converse_stream.return_value = {
+        "stream": [
+            {"messageStart": {"role": "assistant"}},
+            {"contentBlockDelta": {"delta": {"text": "Hello"}, "contentBlockIndex": 0}},
+            {
+                "contentBlockDelta": {
+                    "delta": {"text": " world"},
+                    "contentBlockIndex": 0,
+                }
+            },
+            {"contentBlockStop": {"contentBlockIndex": 0}},
+            {"messageStop": {"stopReason": "end_turn"}},
+            {"metadata": {"usage": {"inputTokens": 5, "outputTokens": 2}}},
+        ]
+    }
+
+    response = model.invoke(
+        mock_client, "Hi", system="Be brief", temperature=0.2, max_tokens=100
+    )
+    assert response == {
+        "type": "message",
+        "content": "Hello world",
+        "usage": {"input_tokens": 5, "output_tokens": 2},
+    }
+
+    mock_client.invoke_model_with_response_stream.assert_not_called()
+    assert mock_client.converse_stream.call_args[1] == {
+        "modelId": "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+        "messages": [{"role": "user", "content": [{"text": "Hi"}]}],
+        "system": [{"text": "Be brief"}],
+        "inferenceConfig": {"temperature": 0.2, "maxTokens": 100},
+        "performanceConfig": {"latency": "optimized"},
+    }
+
+    with pytest.raises(ValueError, match="Invalid API"):
+        model.set_config({"api": "chat"})
+
+
+def test_converse_tool_use(mock_client: MagicMock) -> None:
+    """Test Converse tool use events become a tool call response."""
+    model = ClaudeModel("us.anthropic.claude-3-5-sonnet-20241022-v2:0", api="converse")
+    schema = {
+        "name": "calculator",
+        "description": "Evaluate arithmetic",
+        "parameters": {"type": "object", "properties": {}},
+    }
+    mock_client.converse_stream.return_value = {
+        "stream": [
+            {
+                "contentBlockStart": {
+                    "start": {"toolUse": {"toolUseId": "tool_1", "name": "calculator"}},
+                    "contentBlockIndex": 0,
+                }
+            },
+            {
+                "contentBlockDelta": {
+                    "delta": {"toolUse": {"input": '{"expression": "2 + 2"}'}},
+                    "contentBlockIndex": 0,
+                }
+            },
+            {"messageStop": {"stopReason": "tool_use"}},
+        ]
+    }
+
+    assert model.invoke(mock_client, "What is 2 + 2?", tools=[schema]) == {
+        "type": "tool_call",
+        "tool_calls": [
+            {
+                "id": "tool_1",
+                "type": "function",
+                "function": {
+                    "name": "calculator",
+                    "arguments": {"expression": "2 + 2"},
+                },
+            }
+        ],
+    }
+    assert mock_client.converse_stream.call_args[1]["toolConfig"] == {
+        "tools": [
+            {
+                "toolSpec": {
+                    "name": "calculator",
+                    "description": "Evaluate arithmetic",
+                    "inputSchema": {"json": {"type": "object", "properties": {}}},
+                }
+            }
+        ]
+    }
+
+
+@pytest.mark.parametrize(
+    "raw,expected",
+    [
+        (
+            b'{"type":"content_block_delta","index":0,'
+            b'"delta":{"type":"text_delta","text":"Hi \xc3\xa9"}}',
+            "Hi é",
+        ),
+        (
+            b'{"type":"content_block_delta","index":0,'
+            b'"delta":{"type":"text_delta","text":"say \\"hi\\""}}',
+            None,
+        ),
+        (
+            b'{"type":"content_block_delta","index":1,'
+            b'"delta":{"type":"input_json_delta","partial_json":"{}"}}',
+            None,
+        ),
+        (b'{"type": "content_block_delta", "delta": {"text": "Hi"}}', None),
+    ],
+)
+def test_scan_delta_text(raw: bytes, expected) -> None:
+    """Test compact text deltas are read without a parse, others fall back."""
+    assert _scan_delta_text(raw) == expected
+
+
+def test_extract_content_without_orjson(model: ClaudeModel) -> None:
+    """Test text deltas are scanned when the standard library backend is used."""
+    chunks = [
+        b'{"type":"content_block_delta","index":0,'
+        b'"delta":{"type":"text_delta","text":"Say "}}',
+        b'{"type":"content_block_delta","index":0,'
+        b'"delta":{"type":"text_delta","text":"\\"hi\\""}}',
+    ]
+    response = {"body": [{"chunk": {"bytes": raw}} for raw in chunks]}
+
+    with patch("bedrock_swarm.serialization.orjson", None), patch(
+        "bedrock_swarm.models.claude.serialization.loads", side_effect=json.loads
+    ) as loads:
+        assert model._extract_content(response) == 'Say "hi"'
+    # Only the delta with escapes needed a full parse
+    assert loads.call_count == 1
@@ -0,0 +1,98 @@
+"""Tests for the model factory module."""
+
+import copy
+from typing import Generator
+
+import pytest
+
+from bedrock_swarm.models.claude import ClaudeModel
+from bedrock_swarm.models.factory import ModelFactory
+from bedrock_swarm.models.titan import TitanModel
+
+
+@pytest.fixture(autouse=True)
+def restore_registry() -> Generator[None, None, None]:
+    """Restore the model registry after each test."""
+    saved = copy.deepcopy(ModelFactory._model_registry)
+    yield
+    ModelFactory._model_registry.clear()
+    ModelFactory._model_registry.update(saved)
+    ModelFactory._build_index()
+
+
+def test_create_model() -> None:
+    """Test model creation through the dispatch table."""
+    model = ModelFactory.create_model("us.anthropic.claude-3-5-sonnet-20241022-v2:0")
+    assert isinstance(model, ClaudeModel)
+    assert model._config["max_tokens"] == 200000
+
+    model = ModelFactory.create_model("amazon.titan-text-lite-v1")
+    assert isinstance(model, TitanModel)
+    assert model._config["max_tokens"] == 4000
+
+    # Each call creates an independent instance
+    assert ModelFactory.create_model(
+        "amazon.titan-text-lite-v1"
+    ) is not ModelFactory.create_model("amazon.titan-text-lite-v1")
+
+
+def test_create_model_errors() -> None:
+    """Test error reporting for unsupported model IDs."""
+    with pytest.raises(ValueError, match="Unsupported model family"):
+        ModelFactory.create_model("unknown.model-v1")
+
+    with pytest.raises(ValueError, match="Unsupported version 'v2'"):
+        ModelFactory.create_model("amazon.titan-text-lite-v2")
+
+
+def test_register_model() -> None:
+    """Test registered models are immediately available."""
+    config = {"max_tokens": 1000, "default_tokens": 500}
+    ModelFactory.register_model("amazon.titan-text-custom", "v1", TitanModel, config)
+
+    model = ModelFactory.create_model("amazon.titan-text-custom-v1")
+    assert isinstance(model, TitanModel)
+    assert model._config["max_tokens"] == 1000
+    supported = ModelFactory.get_supported_models()
+    assert "amazon.titan-text-custom" in supported
+
+    # The registry can only be changed through register_model
+    with pytest.raises(TypeError):
+        supported["amazon.titan-text-other"] = {}  # type: ignore[index]
+
+
+def test_family_match_prefers_longest_family() -> None:
+    """Test overlapping families resolve to the most specific one."""
+    config = {"max_tokens": 1000, "default_tokens": 500}
+    ModelFactory.register_model("amazon.titan-text", "v1", TitanModel, config)
+
+    with pytest.raises(
+        ValueError, match="'v9' for model family 'amazon.titan-text-lite'"
+    ):
+        ModelFactory.create_model("amazon.titan-text-lite-v9")
+
+
+def test_match_family() -> None:
+    """Test family lookup through the prefix trie."""
+    assert (
+        ModelFactory._match_family("amazon.titan-text-lite-v1")
+        == "amazon.titan-text-lite"
+    )
+    assert ModelFactory._match_family("amazon.titan") is None
+    assert ModelFactory._match_family("") is None
+
+
+def test_lazy_model_class() -> None:
+    """Test "module:Class" registry entries are imported on first use."""
+    config = {"max_tokens": 1000, "default_tokens": 500}
+    ModelFactory.register_model(
+        "amazon.titan-text-lazy", "v1", "bedrock_swarm.models.titan:TitanModel", config
+    )
+    entry = ModelFactory._model_registry["amazon.titan-text-lazy"]["v1"]
+    assert entry["class"] == "bedrock_swarm.models.titan:TitanModel"
+
+    assert isinstance(
+        ModelFactory.create_model("amazon.titan-text-lazy-v1"), TitanModel
+    )
+    # The resolved class is cached back into the registry
+    assert entry["class"] is TitanModel
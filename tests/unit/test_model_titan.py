@@ -291,3 +291,33 @@ def test_extract_content_error_handling(model: TitanModel) -> None:
     mock_response = {"body": [{"chunk": None}]}
     result = model.process_response(mock_response)
     assert result == {"type": "message", "content": ""}
+
+
+def test_invoke_uses_shared_flow(model: TitanModel, mock_client: MagicMock) -> None:
+    """Test invoke goes through the base request, retry and parsing flow."""
+    mock_client.invoke_model_with_response_stream.return_value = {
+        "body": [{"chunk": {"bytes": json.dumps({"outputText": "Hi"}).encode()}}]
+    }
+
+    assert model.invoke(mock_client, "Hello", max_tokens=100) == {
+        "type": "message",
+        "content": "Hi",
+    }
+    body = json.loads(
+        mock_client.invoke_model_with_response_stream.call_args[1]["body"]
+    )
+    assert body["inputText"] == "Hello"
+
+
+def test_serialize_request(model: TitanModel) -> None:
+    """Test request serialization matches the request dictionary."""
+    request = model.format_request(
+        message='Say "hi"\n', system="Système", temperature=0.25, max_tokens=100
+    )
+    body = model._serialize_request(request)
+    assert body.startswith(b'{"inputText":')
+    assert json.loads(body) == request
+
+    # Requests with other generation settings use full serialization
+    request["textGenerationConfig"]["stopSequences"] = ["User:"]
+    assert json.loads(model._serialize_request(request)) == request
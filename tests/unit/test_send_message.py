@@ -91,6 +91,36 @@ def test_successful_message_send(send_message_tool, mock_thread, mock_agency):
     )
 
 
+def test_response_cache(mock_thread, mock_agency):
+    """Test cached responses are reused for repeated messages."""
+    tool = SendMessageTool(
+        valid_recipients=["agent1", "agent2"], agency=mock_agency, cache=True
+    )
+
+    for _ in range(2):
+        assert (
+            tool._execute_impl(
+                recipient="agent1", message="Test message", thread=mock_thread
+            )
+            == "Response from recipient"
+        )
+    assert mock_agency.get_completion.call_count == 1
+
+    # A different recipient, message or thread is sent on
+    tool._execute_impl(recipient="agent2", message="Test message", thread=mock_thread)
+    tool._execute_impl(recipient="agent1", message="Other message", thread=mock_thread)
+    other_thread = MagicMock()
+    other_thread.id = "other_thread_id"
+    tool._execute_impl(recipient="agent1", message="Test message", thread=other_thread)
+    assert mock_agency.get_completion.call_count == 4
+
+    # The least recently used response is evicted once the cache is full
+    tool._CACHE_MAX_SIZE = 2
+    tool._execute_impl(recipient="agent2", message="New message", thread=mock_thread)
+    tool._execute_impl(recipient="agent1", message="Test message", thread=mock_thread)
+    assert mock_agency.get_completion.call_count == 6
+
+
 def test_invalid_recipient(send_message_tool, mock_thread):
     """Test sending message to invalid recipient."""
     with pytest.raises(ValueError, match="Invalid recipient: invalid_agent"):
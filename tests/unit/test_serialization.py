@@ -0,0 +1,33 @@
+"""Tests for JSON serialization helpers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from bedrock_swarm import serialization
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request: pytest.FixtureRequest):
+    """Run each test with both the orjson and standard library backends."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        yield
+    else:
+        with patch.object(serialization, "orjson", None):
+            yield
+
+
+def test_round_trip(backend) -> None:
+    """Test objects survive a dumps/loads round trip."""
+    obj = {"text": "héllo", "values": [1, 2.5, None, True], "nested": {"a": "b"}}
+    data = serialization.dumps(obj)
+    assert isinstance(data, bytes)
+    assert serialization.loads(data) == obj
+    assert serialization.loads(data.decode()) == obj
+
+
+def test_invalid_json(backend) -> None:
+    """Test invalid documents raise the standard decode error."""
+    with pytest.raises(serialization.JSONDecodeError):
+        serialization.loads(b"invalid json")
@@ -157,7 +157,7 @@ def test_thread_initialization(thread: Thread) -> None:
 
 def test_process_message_basic(thread: Thread) -> None:
     """Test basic message processing."""
-    with patch.object(thread.agent, "generate") as mock_generate:
+    with patch.object(BedrockAgent, "generate") as mock_generate:
         mock_generate.return_value = {"type": "message", "content": "Test response"}
         response = thread.process_message("Test message")
 
@@ -206,7 +206,7 @@ def test_process_message_with_tool_calls(thread: Thread) -> None:
     # Mock final response
     final_response = {"type": "message", "content": "Final response"}
 
-    with patch.object(thread.agent, "generate") as mock_generate:
+    with patch.object(BedrockAgent, "generate") as mock_generate:
         mock_generate.side_effect = [tool_call_response, final_response]
         response = thread.process_message("Test message")
 
@@ -264,7 +264,7 @@ def test_process_message_with_tool_error(thread: Thread) -> None:
         ],
     }
 
-    with patch.object(thread.agent, "generate") as mock_generate:
+    with patch.object(BedrockAgent, "generate") as mock_generate:
         mock_generate.return_value = tool_call_response
         response = thread.process_message("Test message")
 
@@ -316,7 +316,7 @@ def test_process_message_with_invalid_tool(thread: Thread) -> None:
         ],
     }
 
-    with patch.object(thread.agent, "generate") as mock_generate:
+    with patch.object(BedrockAgent, "generate") as mock_generate:
         mock_generate.return_value = tool_call_response
         response = thread.process_message("Test message")
 
@@ -347,7 +347,7 @@ def test_process_message_with_invalid_arguments(thread: Thread) -> None:
         ],
     }
 
-    with patch.object(thread.agent, "generate") as mock_generate:
+    with patch.object(BedrockAgent, "generate") as mock_generate:
         mock_generate.return_value = tool_call_response
         response = thread.process_message("Test message")
 
@@ -363,7 +363,7 @@ def test_process_message_with_invalid_arguments(thread: Thread) -> None:
 
 def test_process_message_with_agent_error(thread: Thread) -> None:
     """Test processing a message when agent.generate raises an error."""
-    with patch.object(thread.agent, "generate") as mock_generate:
+    with patch.object(BedrockAgent, "generate") as mock_generate:
         mock_generate.side_effect = Exception("Agent error")
         response = thread.process_message("Test message")
 
@@ -440,7 +440,7 @@ def test_run_management(thread: Thread) -> None:
 
 def test_message_recording(thread: Thread) -> None:
     """Test comprehensive message recording."""
-    with patch.object(thread.agent, "generate") as mock_generate:
+    with patch.object(BedrockAgent, "generate") as mock_generate:
         # Test recording user message
         mock_generate.return_value = {"type": "message", "content": "Test response"}
         thread.process_message("Test message")
@@ -478,7 +478,7 @@ def test_tool_result_recording(thread: Thread) -> None:
     # Mock final response
     final_response = {"type": "message", "content": "Final response"}
 
-    with patch.object(thread.agent, "generate") as mock_generate:
+    with patch.object(BedrockAgent, "generate") as mock_generate:
         mock_generate.side_effect = [tool_call_response, final_response]
         thread.process_message("Test message")
 
@@ -512,7 +512,7 @@ def test_tool_result_recording(thread: Thread) -> None:
 
 def test_error_recording(thread: Thread) -> None:
     """Test recording of error messages."""
-    with patch.object(thread.agent, "generate") as mock_generate:
+    with patch.object(BedrockAgent, "generate") as mock_generate:
         # Simulate an error
         mock_generate.side_effect = Exception("Test error")
         response = thread.process_message("Test message")
@@ -553,7 +553,7 @@ def test_context_window_with_metadata(thread: Thread) -> None:
 
 def test_message_metadata_persistence(thread: Thread) -> None:
     """Test that metadata is properly persisted in message history."""
-    with patch.object(thread.agent, "generate") as mock_generate:
+    with patch.object(BedrockAgent, "generate") as mock_generate:
         # Mock a tool call sequence
         tool_call_response = {
             "type": "tool_call",
@@ -1,12 +1,18 @@
 """Tests for time tool implementation."""
 
 from datetime import datetime
-from zoneinfo import ZoneInfo
+from unittest.mock import patch
+from zoneinfo import ZoneInfo, available_timezones
 
 import pytest
 
 from bedrock_swarm.exceptions import ToolError
-from bedrock_swarm.tools.time import CurrentTimeTool
+from bedrock_swarm.tools.time import (
+    CurrentTimeTool,
+    _available_timezones,
+    _normalize_timezone,
+    _zoneinfo,
+)
 
 
 @pytest.fixture
@@ -213,3 +219,54 @@ def test_timezone_with_offset(time_tool: CurrentTimeTool) -> None:
     result_time = result_time.replace(tzinfo=ZoneInfo("UTC"))
     delta = (current - result_time).total_seconds() / 60
     assert 29 <= delta <= 31  # Allow for small timing differences
+
+
+def test_available_timezones_cached(time_tool: CurrentTimeTool) -> None:
+    """Test the timezone database is only scanned once."""
+    _available_timezones.cache_clear()
+    _normalize_timezone.cache_clear()
+    with patch(
+        "zoneinfo.available_timezones", wraps=available_timezones
+    ) as mock_available:
+        time_tool.execute(timezone="Europe/Zurich")
+        time_tool.execute(timezone="utc")
+        with pytest.raises(ToolError):
+            time_tool.execute(timezone="InvalidZone")
+
+    assert mock_available.call_count == 1
+
+
+def test_normalize_timezone_cached(time_tool: CurrentTimeTool) -> None:
+    """Test repeated timezone names are only normalized once."""
+    _normalize_timezone.cache_clear()
+
+    assert time_tool._normalize_timezone("utc") == "UTC"
+    assert time_tool._normalize_timezone("utc") == "UTC"
+    assert time_tool._normalize_timezone("pst") == "America/Los_Angeles"
+
+    info = _normalize_timezone.cache_info()
+    assert info.misses == 2
+    assert info.hits == 1
+
+
+def test_zoneinfo_cached(time_tool: CurrentTimeTool) -> None:
+    """Test ZoneInfo instances are shared across calls."""
+    _zoneinfo.cache_clear()
+
+    time_tool.execute(timezone="Asia/Tokyo")
+    time_tool.execute(timezone="JST")
+
+    info = _zoneinfo.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_local_timezone(time_tool: CurrentTimeTool) -> None:
+    """Test "local" uses the local timezone without a timezone lookup."""
+    with patch("bedrock_swarm.tools.time._normalize_timezone") as mock_normalize:
+        result = time_tool.execute(timezone="local")
+        time_tool.execute(timezone="Local")
+
+    mock_normalize.assert_not_called()
+    local_time = datetime.strptime(" ".join(result.split()[:2]), "%Y-%m-%d %H:%M:%S")
+    assert abs((datetime.now() - local_time).total_seconds()) < 60
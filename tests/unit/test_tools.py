@@ -1,7 +1,7 @@
 """Tests for the tools functionality."""
 
 from typing import Any, Dict
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -67,3 +67,15 @@ def test_tool_execution():
     result = tool.execute(param1="test", param2=123)
     assert result == "Mock result"
     tool._execute_mock.assert_called_once_with(param1="test", param2=123)
+
+
+def test_schema_cached():
+    """Test the schema is built once and reused for parameter validation."""
+    tool = MockTool(name="mock_tool", description="Mock tool")
+    with patch.object(tool, "get_schema", wraps=tool.get_schema) as mock_schema:
+        tool.execute(param1="a")
+        tool.execute(param1="b", param2=2)
+        with pytest.raises(Exception, match="Invalid parameter type"):
+            tool.execute(param1="c", param2="not an int")
+    mock_schema.assert_not_called()
+    assert tool.schema is tool.schema
@@ -1,5 +1,6 @@
 """Tests for the tools factory module."""
 
+import threading
 from typing import Any, Dict, Generator, cast
 from unittest.mock import MagicMock
 
@@ -93,3 +94,28 @@ def test_get_tool_types() -> None:
     tool_types = ToolFactory.get_tool_types()
     assert "MockTool" in tool_types
     assert tool_types["MockTool"] == MockTool
+
+    # The view is read-only
+    with pytest.raises(TypeError):
+        tool_types["Other"] = MockTool
+
+
+def test_concurrent_registration() -> None:
+    """Test concurrent registration of the same type succeeds exactly once."""
+    results = []
+
+    def register() -> None:
+        try:
+            ToolFactory.register_tool_type(MockTool)
+            results.append(True)
+        except ToolError:
+            results.append(False)
+
+    threads = [threading.Thread(target=register) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count(True) == 1
+    assert ToolFactory.get_tool_types()["MockTool"] == MockTool